@@ -0,0 +1,42 @@
+"""measures the import time of the package and the first access of each public name
+
+run from the repository root with `PYTHONPATH=src python benchmarks/bench_import_time.py`
+"""
+
+import subprocess
+import sys
+
+import py_math_omm
+
+REPEAT = 5
+
+
+def measure(statement: str) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import py_math_omm\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(REPEAT)
+    ]
+    return min(times)
+
+
+def main() -> None:
+    print(f"{'import py_math_omm':<40} {measure('pass') * 1e3:8.2f} ms")
+
+    for name in py_math_omm.__all__:
+        statement = f"py_math_omm.{name}"
+        print(f"{statement:<40} {measure(statement) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""micro-benchmark of the Quaternion operators against the isinstance chains they replaced
+
+run from the repository root with `PYTHONPATH=src python benchmarks/bench_quaternion_dispatch.py`
+"""
+
+import timeit
+from py_math_omm.quaternion import Quaternion
+
+
+def legacy_mul(self: Quaternion, other) -> Quaternion:
+    if isinstance(other, (int, float)):
+        return Quaternion(
+            self.r * other, self.i * other, self.j * other, self.k * other
+        )
+    if isinstance(other, complex):
+        r, i = other.real, other.imag
+        return Quaternion(
+            self.r * r - self.i * i,
+            self.r * i + self.i * r,
+            self.j * r + self.k * i,
+            -self.j * i + self.k * r,
+        )
+    if isinstance(other, Quaternion):
+        r, i, j, k = other.r, other.i, other.j, other.k
+        return Quaternion(
+            self.r * r - self.i * i - self.j * j - self.k * k,
+            self.r * i + self.i * r + self.j * k - self.k * j,
+            self.r * j - self.i * k + self.j * r + self.k * i,
+            self.r * k + self.i * j - self.j * i + self.k * r,
+        )
+
+
+def legacy_rmul(self: Quaternion, other) -> Quaternion:
+    if isinstance(other, (int, float, complex)):
+        return legacy_mul(Quaternion(other), self)
+    if isinstance(other, Quaternion):
+        return legacy_mul(other, self)
+
+
+def legacy_add(self: Quaternion, other) -> Quaternion:
+    if isinstance(other, (int, float)):
+        return Quaternion(self.r + other, self.i, self.j, self.k)
+    if isinstance(other, complex):
+        return Quaternion(self.r + other.real, self.i + other.imag, self.j, self.k)
+    if isinstance(other, Quaternion):
+        return Quaternion(
+            self.r + other.r, self.i + other.i, self.j + other.j, self.k + other.k
+        )
+
+
+def legacy_eq(self: Quaternion, other) -> bool:
+    if isinstance(other, (int | float)):
+        other = float(other)
+        if self.is_real:
+            return self.r == other
+        return False
+    if isinstance(other, complex):
+        if self.is_py_complex:
+            return (self.r == other.real) and (self.i == other.imag)
+        return False
+    if isinstance(other, Quaternion):
+        return (
+            (self.r == other.r)
+            and (self.i == other.i)
+            and (self.j == other.j)
+            and (self.k == other.k)
+        )
+    return other.__eq__(self)
+
+
+def bench(name: str, legacy, current, number: int = 200_000) -> None:
+    legacy_time = min(timeit.repeat(legacy, number=number, repeat=5))
+    current_time = min(timeit.repeat(current, number=number, repeat=5))
+    print(
+        f"{name:<24} legacy {legacy_time / number * 1e9:8.1f} ns"
+        f"   dispatch {current_time / number * 1e9:8.1f} ns"
+        f"   speedup {legacy_time / current_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    q = Quaternion(1.5, -2.0, 0.25, 3.0)
+    p = Quaternion(0.5, 1.0, -1.5, 2.0)
+    c = complex(2.0, -1.0)
+
+    bench("float * quaternion", lambda: legacy_rmul(q, 2.5), lambda: 2.5 * q)
+    bench("complex * quaternion", lambda: legacy_rmul(q, c), lambda: c * q)
+    bench("quaternion * float", lambda: legacy_mul(q, 2.5), lambda: q * 2.5)
+    bench("quaternion * quaternion", lambda: legacy_mul(q, p), lambda: q * p)
+    bench("quaternion + quaternion", lambda: legacy_add(q, p), lambda: q + p)
+    bench("quaternion == quaternion", lambda: legacy_eq(q, p), lambda: q == p)
+
+
+if __name__ == "__main__":
+    main()
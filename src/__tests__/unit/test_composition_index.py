@@ -0,0 +1,47 @@
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.composition_index import CompositionIndex
+
+quaternions = [Quaternion(i, 2 * i - 3, 1, -i) for i in range(1, 12)]
+
+
+def fold(values: list[Quaternion]) -> Quaternion:
+    result = Quaternion(1)
+    for q in values:
+        result = result * q
+    return result
+
+
+def test_range_products():
+    index = CompositionIndex(quaternions)
+
+    assert len(index) == len(quaternions)
+    for start in range(len(quaternions) + 1):
+        for stop in range(start, len(quaternions) + 1):
+            assert index.product(start, stop) == fold(quaternions[start:stop])
+
+
+def test_update():
+    index = CompositionIndex(quaternions)
+    updated = list(quaternions)
+
+    index.update(3, Quaternion(0, 1, 0, 0))
+    index[-1] = Quaternion(2, 0, 1, 0)
+    updated[3] = Quaternion(0, 1, 0, 0)
+    updated[-1] = Quaternion(2, 0, 1, 0)
+
+    assert index[3] == updated[3]
+    assert index.product() == fold(updated)
+    assert index.product(2, 9) == fold(updated[2:9])
+
+
+def test_invalid_ranges():
+    index = CompositionIndex(quaternions)
+
+    assert CompositionIndex().product() == Quaternion(1)
+    with pytest.raises(IndexError):
+        index.product(0, len(quaternions) + 1)
+    with pytest.raises(ValueError):
+        index.product(5, 2)
+    with pytest.raises(IndexError):
+        index.update(len(quaternions), Quaternion(1))
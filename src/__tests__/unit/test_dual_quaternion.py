@@ -0,0 +1,106 @@
+import math
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.rotation import rotate_vector
+from ...py_math_omm.dual_quaternion import (
+    DualQuaternion,
+    compose_batch,
+    transform_batch,
+)
+
+float_persition = 0.1**9
+
+
+def vectors_equal(v1: Vector, v2: Vector):
+    return all(abs(a - b) < float_persition for a, b in zip(v1, v2))
+
+
+def values_tuple(dq: DualQuaternion):
+    return (dq.real.r, dq.real.i, dq.real.j, dq.real.k, dq.dual.r, *dq.dual.imag)
+
+
+def dual_quaternions_equal(dq1: DualQuaternion, dq2: DualQuaternion):
+    return all(
+        abs(a - b) < float_persition
+        for a, b in zip(values_tuple(dq1), values_tuple(dq2))
+    )
+
+
+rotation_1 = Quaternion(1, 2, 3, 4).normalize()
+rotation_2 = Quaternion(-0.5, 0.1, 2, 0.3).normalize()
+translation_1 = Vector(1, -2, 3)
+translation_2 = Vector(0.5, 4, -1)
+transform_1 = DualQuaternion.from_rotation_translation(rotation_1, translation_1)
+transform_2 = DualQuaternion.from_rotation_translation(rotation_2, translation_2)
+point = Vector(0.3, -0.7, 2)
+
+
+def test_rotation_translation():
+    assert transform_1.rotation == rotation_1
+    assert vectors_equal(transform_1.translation, translation_1)
+    assert vectors_equal(
+        transform_1.transform_point(point),
+        rotate_vector(rotation_1, point) + translation_1,
+    )
+
+
+def test_composition():
+    composed = transform_1 * transform_2
+
+    assert vectors_equal(
+        composed.transform_point(point),
+        transform_1.transform_point(transform_2.transform_point(point)),
+    )
+    assert compose_batch([transform_1], [transform_2]) == [composed]
+
+
+def test_inverse():
+    assert dual_quaternions_equal(transform_1 * transform_1.inverse(), DualQuaternion())
+    assert vectors_equal(
+        transform_1.inverse().transform_point(transform_1.transform_point(point)), point
+    )
+
+
+def test_normalize():
+    normalized = (transform_1 * 3).normalize()
+
+    assert dual_quaternions_equal(normalized, transform_1)
+
+
+def test_pow():
+    assert dual_quaternions_equal(transform_1**1, transform_1)
+    assert dual_quaternions_equal(transform_1**0, DualQuaternion())
+    half = transform_1**0.5
+    assert dual_quaternions_equal(half * half, transform_1)
+
+
+def test_sclerp():
+    start = DualQuaternion.from_rotation_translation(translation=Vector(0, 0, 0))
+    end = DualQuaternion.from_rotation_translation(
+        Quaternion(math.cos(math.pi / 4), 0, 0, math.sin(math.pi / 4)), Vector(0, 0, 2)
+    )
+    middle = start.sclerp(end, 0.5)
+
+    assert dual_quaternions_equal(start.sclerp(end, 0), start)
+    assert dual_quaternions_equal(start.sclerp(end, 1), end)
+    assert vectors_equal(middle.translation, Vector(0, 0, 1))
+    assert vectors_equal(
+        middle.transform_point(Vector(1, 0, 0)),
+        Vector(math.cos(math.pi / 4), math.sin(math.pi / 4), 1),
+    )
+
+
+def test_transform_batch():
+    points = [point, Vector(1, 1, 1)]
+
+    assert transform_batch([transform_1, transform_2], points) == [
+        transform_1.transform_point(points[0]),
+        transform_2.transform_point(points[1]),
+    ]
+    assert transform_1.transform_points(points) == [
+        transform_1.transform_point(p) for p in points
+    ]
+
+    with pytest.raises(ValueError):
+        transform_batch([transform_1], points)
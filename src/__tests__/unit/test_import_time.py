@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from ... import py_math_omm
+
+# seconds the bare package import may take, it should stay in the low milliseconds
+IMPORT_TIME_BUDGET = 0.015
+
+package_parent = Path(py_math_omm.__file__).parents[1]
+
+
+def run_fresh(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=package_parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_time_budget():
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import py_math_omm\n"
+        "print(time.perf_counter() - start)"
+    )
+    best = min(float(run_fresh(code)) for _ in range(5))
+
+    assert best < IMPORT_TIME_BUDGET
+
+
+def test_subsystems_load_on_first_use():
+    code = (
+        "import sys\n"
+        "import py_math_omm\n"
+        "loaded = lambda: sorted(m for m in sys.modules if m.startswith('py_math_omm.'))\n"
+        "print(loaded(), 'asyncio' in sys.modules)\n"
+        "py_math_omm.Quaternion\n"
+        "print(loaded())"
+    )
+    before, after = run_fresh(code).splitlines()
+
+    assert before == "[] False"
+    assert after == "['py_math_omm.quaternion', 'py_math_omm.types']"
+
+
+def test_lazy_attributes():
+    from ...py_math_omm.quaternion import Quaternion
+    from ...py_math_omm import rotation
+
+    assert py_math_omm.Quaternion is Quaternion
+    assert py_math_omm.rotation is rotation
+    assert set(py_math_omm.__all__) <= set(dir(py_math_omm))
+    for name in py_math_omm.__all__:
+        assert getattr(py_math_omm, name).__name__ == name
+
+    with pytest.raises(AttributeError):
+        py_math_omm.Octonion
@@ -0,0 +1,82 @@
+import math
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.rotation import angular_distance, from_axis_angle, rotate_vector
+from ...py_math_omm.integration import INTEGRATION_METHODS, integrate
+
+start = from_axis_angle(Vector(1, 1, 0), 0.7)
+velocity = Vector(0.3, -0.2, 1.1)
+
+
+def run(method: str, body_frame: bool, steps: int = 100, dt: float = 0.01):
+    orientations = [Quaternion(start.r, start.i, start.j, start.k)]
+    for _ in range(steps):
+        integrate(orientations, [velocity], dt, method, body_frame)
+    return orientations[0]
+
+
+def expected(body_frame: bool, time: float = 1.0) -> Quaternion:
+    step = from_axis_angle(velocity, abs(velocity) * time)
+    return start * step if body_frame else step * start
+
+
+@pytest.mark.parametrize("dt", [0.01, -0.01])
+@pytest.mark.parametrize("body_frame", [False, True])
+@pytest.mark.parametrize(
+    "method,tolerance", [("exp", 1e-12), ("rk4", 1e-9), ("euler", 1e-3)]
+)
+def test_methods(method, tolerance, body_frame, dt):
+    result = run(method, body_frame, dt=dt)
+
+    assert angular_distance(result, expected(body_frame, 100 * dt)) < tolerance
+    assert abs(abs(result) - 1) < 1e-12
+
+
+def test_exp_large_negative_step():
+    orientations = [Quaternion(1)]
+    integrate(orientations, [Vector(0, 0, math.pi)], -0.5)
+
+    exact = from_axis_angle(Vector(0, 0, 1), -math.pi / 2)
+    assert angular_distance(orientations[0], exact) < 1e-12
+
+
+def test_body_frame_velocity():
+    world = rotate_vector(start, velocity)
+    orientations = [Quaternion(start.r, start.i, start.j, start.k)]
+    integrate(orientations, [world], 1.0)
+
+    assert angular_distance(orientations[0], expected(True)) < 1e-12
+
+
+def test_many_bodies_in_place():
+    orientations = [Quaternion(1), Quaternion(0, 1, 0, 0)]
+    first = orientations[0]
+    integrate(orientations, [Vector(0, 0, math.pi), Vector(0, 0, 0)], 1.0)
+
+    assert orientations[0] is first
+    assert angular_distance(first, Quaternion(0, 0, 0, 1)) < 1e-12
+    assert orientations[1] == Quaternion(0, 1, 0, 0)
+
+
+def test_without_normalize():
+    orientations = [Quaternion(1)]
+    integrate(orientations, [Vector(0, 0, 1)], 0.5, "euler", normalize=False)
+
+    assert abs(orientations[0]) > 1
+
+
+def test_invalid_arguments():
+    assert "exp" in INTEGRATION_METHODS
+
+    with pytest.raises(ValueError):
+        integrate([Quaternion(1)], [velocity], 0.1, "verlet")
+    with pytest.raises(ValueError):
+        integrate([Quaternion(1)], [], 0.1)
+    with pytest.raises(ValueError):
+        integrate([Quaternion(1)], [Vector(1, 2)], 0.1)
+
+    orientations = [Quaternion(1), Quaternion(1)]
+    with pytest.raises(ValueError):
+        integrate(orientations, [Vector(1, 0, 0), Vector(1, 2)], 0.1)
+    assert orientations == [Quaternion(1), Quaternion(1)]
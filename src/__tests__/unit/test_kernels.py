@@ -0,0 +1,57 @@
+import pytest
+from ...py_math_omm import kernels
+from ...py_math_omm.vector import Vector
+
+
+@pytest.fixture
+def restore_kernels():
+    yield
+    kernels.set_max_dimension(kernels.DEFAULT_MAX_DIMENSION)
+    kernels.clear_kernels()
+
+
+def without_kernels(func):
+    max_dimension = kernels.get_max_dimension()
+    kernels.set_max_dimension(0)
+    try:
+        return func()
+    finally:
+        kernels.set_max_dimension(max_dimension)
+
+
+@pytest.mark.parametrize("dimension", [1, 3, 8, 64])
+def test_kernels_match_loops(restore_kernels, dimension):
+    v1 = Vector.from_iterable(range(1, dimension + 1))
+    v2 = Vector.from_iterable(range(dimension, 0, -1))
+    v3 = v1 * 2.5
+
+    for a, b in [(v1, v2), (v1, v3), (v3, v1), (v1, v1)]:
+        expected = without_kernels(lambda: (a.dot(b), a + b, a == b, a.is_parralel(b)))
+
+        assert (a.dot(b), a + b, a == b, a.is_parralel(b)) == expected
+
+
+def test_kernel_stats(restore_kernels):
+    kernels.clear_kernels()
+
+    Vector(1, 2, 3).dot(Vector(4, 5, 6))
+    Vector(1, 2) + Vector(3, 4)
+
+    stats = kernels.kernel_stats()
+    assert stats["dot"] == [3]
+    assert stats["add"] == [2]
+    assert stats["eq"] == []
+
+
+def test_max_dimension(restore_kernels):
+    kernels.set_max_dimension(4)
+
+    assert kernels.get_kernel("dot", 4) is not None
+    assert kernels.get_kernel("dot", 5) is None
+    assert Vector(1, 1, 1, 1, 1).dot(Vector(1, 2, 3, 4, 5)) == 15
+
+    kernels.set_max_dimension(2)
+    assert kernels.kernel_stats()["dot"] == []
+
+    with pytest.raises(ValueError):
+        kernels.get_kernel("cross", 3)
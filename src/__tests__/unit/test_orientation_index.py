@@ -0,0 +1,73 @@
+import math
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.rotation import (
+    angular_distance,
+    canonicalize,
+    from_axis_angle,
+    is_same_rotation,
+)
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.sampling import Sampler
+from ...py_math_omm.orientation_index import OrientationIndex, deduplicate
+
+
+def test_canonicalize():
+    q = Quaternion(-0.5, 0.5, -0.5, 0.5)
+
+    assert canonicalize(q) == -q
+    assert canonicalize(-q) == -q
+    assert canonicalize(Quaternion(0, 0, -1, 0)) == Quaternion(0, 0, 1, 0)
+    assert is_same_rotation(q, -q)
+    assert not is_same_rotation(q, Quaternion(1))
+
+
+def test_angular_distance():
+    a = from_axis_angle(Vector(0, 0, 1), 0.2)
+    b = from_axis_angle(Vector(0, 0, 1), -0.3)
+
+    assert abs(angular_distance(a, b) - 0.5) < 0.1**9
+    assert abs(angular_distance(a, -b) - 0.5) < 0.1**9
+
+
+def test_within_matches_brute_force():
+    rotations = Sampler(11).unit_quaternions(500)
+    queries = Sampler(12).unit_quaternions(50)
+    index = OrientationIndex(0.3)
+    for q in rotations:
+        index.add(q)
+
+    for q in queries:
+        expected = {
+            key for key, r in enumerate(rotations) if angular_distance(q, r) <= 0.3
+        }
+        assert set(index.within(q)) == expected
+        assert set(index.within(-q, 0.6)) == {
+            key for key, r in enumerate(rotations) if angular_distance(q, r) <= 0.6
+        }
+
+
+def test_nearest():
+    rotations = Sampler(13).unit_quaternions(200)
+    index = OrientationIndex(0.05)
+    for q in rotations:
+        index.add(q, payload=q)
+
+    for q in Sampler(14).unit_quaternions(20):
+        key, distance = index.nearest(q)
+        expected = min(angular_distance(q, r) for r in rotations)
+        assert abs(distance - expected) < 0.1**12
+        assert index[key][1] is rotations[key]
+
+    assert OrientationIndex(0.1).nearest(Quaternion(1)) is None
+
+
+def test_deduplicate():
+    base = Sampler(15).unit_quaternions(20)
+    noisy = [q * from_axis_angle(Vector(1, 1, 0), 1e-4) for q in base]
+    signs = [-q if n % 2 else q for n, q in enumerate(noisy)]
+
+    unique, assignments = deduplicate(base + signs, 0.01)
+
+    assert len(unique) == 20
+    assert assignments == list(range(20)) * 2
+    assert all(is_same_rotation(u, q) for u, q in zip(unique, base))
@@ -0,0 +1,66 @@
+import pytest
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.orthonormalize import gram_schmidt, householder_qr
+
+float_persition = 0.1**9
+
+
+def make_vectors():
+    return [Vector(1, 2, 0, 1), Vector(2, 0, 1, -1), Vector(0.5, 1, 3, 1)]
+
+
+def assert_qr(original, basis, r):
+    for i, q_i in enumerate(basis):
+        for j, q_j in enumerate(basis):
+            assert abs(q_i.dot(q_j) - (1 if i == j else 0)) < float_persition
+
+    for k, vector in enumerate(original):
+        rebuilt = [
+            sum(r[i][k] * basis[i][d] for i in range(len(basis))) for d in range(4)
+        ]
+        assert all(abs(a - b) < float_persition for a, b in zip(rebuilt, vector))
+
+    for i in range(len(r)):
+        assert r[i][i] > 0
+        assert all(r[i][j] == 0 for j in range(i))
+
+
+@pytest.mark.parametrize("reorthogonalize", [False, True])
+def test_gram_schmidt(reorthogonalize):
+    vectors = make_vectors()
+    basis, r = gram_schmidt(vectors, reorthogonalize)
+
+    assert basis is vectors
+    assert_qr(make_vectors(), basis, r)
+
+
+def test_householder_qr():
+    vectors = make_vectors()
+    basis, r = householder_qr(vectors)
+
+    assert_qr(make_vectors(), basis, r)
+
+    gram_schmidt_basis, gram_schmidt_r = gram_schmidt(make_vectors())
+    for q1, q2 in zip(basis, gram_schmidt_basis):
+        assert all(abs(a - b) < float_persition for a, b in zip(q1, q2))
+
+
+def test_in_place_views():
+    storage = Vector(1, 1, 0, 1, 0, 0)
+    vectors = [storage.view(0, 3), storage.view(3, 6)]
+
+    gram_schmidt(vectors)
+
+    expected = [2**-0.5, 2**-0.5, 0, 2**-0.5, -(2**-0.5), 0]
+    assert all(abs(a - b) < float_persition for a, b in zip(storage, expected))
+
+
+@pytest.mark.parametrize("method", [gram_schmidt, householder_qr])
+def test_dependent_vectors(method):
+    vectors = [Vector(1, 2, 3), Vector(2, 4, 6)]
+    with pytest.raises(ValueError):
+        method(vectors)
+    assert vectors == [Vector(1, 2, 3), Vector(2, 4, 6)]
+
+    with pytest.raises(ValueError):
+        method([Vector(1, 2, 3), Vector(2, 4)])
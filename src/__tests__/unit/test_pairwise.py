@@ -0,0 +1,61 @@
+import pytest
+from array import array
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.pairwise import block_shape, pairwise_blocks, pairwise_to_file
+
+float_persition = 0.1**9
+
+a = [Vector(i, 2 * i - 3, 1) for i in range(1, 8)]
+b = [Vector(-i, 1, i * i) for i in range(1, 6)] + [Vector(1, -1, 1)]
+
+expected = {
+    "dot": lambda x, y: x.dot(y),
+    "sqeuclidean": lambda x, y: (x - y).abs2(),
+    "euclidean": lambda x, y: abs(x - y),
+    "cosine": lambda x, y: x.dot(y) / (abs(x) * abs(y)),
+}
+
+
+def assemble(blocks, rows, columns):
+    matrix = [[None] * columns for _ in range(rows)]
+    for row_start, column_start, block in blocks:
+        for i, row in enumerate(block, row_start):
+            matrix[i][column_start : column_start + len(row)] = list(row)
+    return matrix
+
+
+@pytest.mark.parametrize("metric", list(expected))
+@pytest.mark.parametrize("memory_budget", [8, 40, 10**6])
+def test_pairwise_blocks(metric, memory_budget):
+    matrix = assemble(pairwise_blocks(a, b, metric, memory_budget), len(a), len(b))
+
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            assert abs(matrix[i][j] - expected[metric](x, y)) < float_persition
+
+
+def test_block_shape():
+    assert block_shape(100, 100, 8 * 250) == (2, 100)
+    assert block_shape(100, 1000, 8 * 250) == (1, 250)
+    assert block_shape(3, 4, 10**6) == (3, 4)
+    assert block_shape(3, 4, 0) == (1, 1)
+
+
+def test_pairwise_to_file(tmp_path):
+    path = tmp_path / "distances.bin"
+
+    assert pairwise_to_file(a, b, path, memory_budget=64) == (len(a), len(b))
+
+    values = array("d")
+    values.frombytes(path.read_bytes())
+    matrix = assemble(pairwise_blocks(a, b), len(a), len(b))
+    assert list(values) == [v for row in matrix for v in row]
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        list(pairwise_blocks(a, [Vector(1, 2)]))
+    with pytest.raises(ValueError):
+        list(pairwise_blocks(a, b, "manhattan"))
+    with pytest.raises(ValueError):
+        list(pairwise_blocks(a, [Vector(0, 0, 0)], "cosine"))
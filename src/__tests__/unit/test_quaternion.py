@@ -1,4 +1,5 @@
 import pytest
+import cmath
 import math
 from ...py_math_omm.quaternion import Quaternion
 from ...py_math_omm.types import real_number
@@ -470,3 +471,127 @@ def test_mod_quat(quat_1, float_num):
 
 def test_divmod(quat_1, float_num):
     assert divmod(quat_1, float_num) == (quat_1 // float_num, quat_1 % float_num)
+
+
+class Scalar:
+    def __init__(self, value):
+        self.value = value
+
+    def __rmul__(self, other):
+        return ("rmul", other)
+
+    def __mul__(self, other):
+        return ("mul", other)
+
+
+def test_unknown_types_return_not_implemented(quat_1):
+    scalar = Scalar(2)
+
+    assert quat_1.__add__(scalar) is NotImplemented
+    assert quat_1.__mul__("2") is NotImplemented
+    assert quat_1.__eq__(scalar) is NotImplemented
+    assert (quat_1 * scalar) == ("rmul", quat_1)
+    assert (scalar * quat_1) == ("mul", quat_1)
+    assert quat_1 != scalar
+
+    with pytest.raises(TypeError):
+        quat_1 + "2"
+
+
+def test_subclass_dispatch(quat_1):
+    class MyFloat(float):
+        pass
+
+    assert (quat_1 * MyFloat(2)) == (quat_1 * 2)
+    assert (True * quat_1) == quat_1
+
+
+def quaternions_equal(q1: Quaternion, q2: Quaternion):
+    return all(
+        floats_equal(v1, v2) for v1, v2 in zip(values_tuple(q1), values_tuple(q2))
+    )
+
+
+@pytest.mark.parametrize(
+    "quat",
+    [Quaternion(2), Quaternion(-2), Quaternion(1, 2), Quaternion(0.5, 0.5, 0.5, 0.5)],
+)
+def test_exp_log(quat_1, quat):
+    for q in (quat, quat_1 / 10, quat_1.normalize()):
+        assert quaternions_equal(q.log().exp(), q)
+
+
+def test_exp_complex(complex_num):
+    quat = Quaternion(complex_num)
+
+    assert quaternions_equal(quat.exp(), Quaternion(cmath.exp(complex_num)))
+    assert quaternions_equal(quat.log(), Quaternion(cmath.log(complex_num)))
+
+
+def test_exp_pure():
+    angle = 0.3
+    quat = Quaternion(0, 0, angle, 0).exp()
+
+    assert quaternions_equal(quat, Quaternion(math.cos(angle), 0, math.sin(angle), 0))
+
+
+def test_log_zero():
+    with pytest.raises(ValueError):
+        Quaternion().log()
+
+
+@pytest.mark.parametrize("power", [0, 1, 2, 5, -3])
+def test_pow_int(quat_1, power):
+    expected = Quaternion(1)
+    for _ in range(abs(power)):
+        expected = expected * quat_1
+    if power < 0:
+        expected = expected.inverse()
+
+    assert quaternions_equal(quat_1**power, expected)
+
+
+def test_pow_real(quat_1):
+    assert quaternions_equal((quat_1**0.5) * (quat_1**0.5), quat_1)
+    assert quaternions_equal(quat_1**2.0, quat_1**2)
+    assert quaternions_equal(quat_1 ** complex(2), quat_1**2)
+    assert quaternions_equal(quat_1 ** Quaternion(-1), quat_1.inverse())
+
+
+def test_sqrt(quat_1):
+    for q in (quat_1, quat_1.normalize(), Quaternion(-4), Quaternion(1, 2)):
+        root = q.sqrt()
+        assert quaternions_equal(root * root, q)
+
+
+@pytest.mark.parametrize(
+    "quat",
+    [
+        Quaternion(-1, 0, 1e-7, 0),
+        Quaternion(-4, 0, 1e-9, 0),
+        Quaternion(-1, 1e-200, 0, 1e-200),
+    ],
+)
+def test_sqrt_near_negative_real_axis(quat):
+    root = quat.sqrt()
+    square = root * root
+
+    assert root.r >= 0
+    assert all(
+        math.isclose(a, b, rel_tol=1e-12)
+        for a, b in zip(values_tuple(square), values_tuple(quat))
+    )
+
+
+def test_tiny_vector_parts():
+    q = Quaternion(0, 0, 1e-200, 0).exp()
+    assert (q.r, q.i, q.j, q.k) == (1.0, 0.0, 1e-200, 0.0)
+
+    q = Quaternion(1, 0, 1e-200, 0).log()
+    assert (q.r, q.i, q.j, q.k) == (0.0, 0.0, 1e-200, 0.0)
+
+    q = Quaternion(-1, 0, 1e-170, 0).log()
+    assert math.isclose(q.j, math.pi) and q.r == 0
+
+    q = Quaternion(1, 0, 1e-200, 0) ** 0.5
+    assert (q.r, q.i, q.j, q.k) == (1.0, 0.0, 5e-201, 0.0)
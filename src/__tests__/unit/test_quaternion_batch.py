@@ -0,0 +1,23 @@
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.quaternion_batch import batch_exp, batch_log, batch_pow, batch_sqrt
+
+quaternions = [Quaternion(1, 2, 3, 4), Quaternion(2), Quaternion(0.5, -1)]
+
+
+def test_batch_functions():
+    assert batch_exp(quaternions) == [q.exp() for q in quaternions]
+    assert batch_log(quaternions) == [q.log() for q in quaternions]
+    assert batch_sqrt(quaternions) == [q.sqrt() for q in quaternions]
+
+
+def test_batch_pow():
+    assert batch_pow(quaternions, 3) == [q**3 for q in quaternions]
+    assert batch_pow(quaternions, [1, 0.5, 2]) == [
+        quaternions[0],
+        quaternions[1] ** 0.5,
+        quaternions[2] ** 2,
+    ]
+
+    with pytest.raises(ValueError):
+        batch_pow(quaternions, [1, 2])
@@ -0,0 +1,78 @@
+from fractions import Fraction
+from ...py_math_omm.generic_vector import GenericVector
+from ...py_math_omm.rational_vector import RationalVector
+
+f = Fraction
+
+
+def test_values_are_reduced_on_observation():
+    vector = RationalVector(f(1, 2), f(1, 3), 2)
+
+    assert vector.denominator == 6
+    assert vector.numerators == [3, 2, 12]
+    assert vector.values == [f(1, 2), f(1, 3), f(2)]
+    assert vector[1] == f(1, 3)
+    assert list(vector) == vector.values
+
+
+def test_deferred_reduction():
+    vector = RationalVector(f(1, 4), f(3, 4)) + RationalVector(f(1, 4), f(1, 4))
+
+    assert vector.denominator == 4
+    assert vector.values == [f(1, 2), f(1)]
+    assert vector.reduce().denominator == 2
+
+
+def test_scaling_does_not_grow_the_denominator():
+    vector = RationalVector(f(1, 3), f(2, 3))
+
+    for _ in range(20):
+        vector = vector * f(3, 7) / f(3, 7)
+
+    assert vector.denominator == 3
+    assert vector.values == [f(1, 3), f(2, 3)]
+
+
+def test_arithmetic_matches_fractions():
+    a = RationalVector(f(1, 2), f(-2, 3), f(5, 7))
+    b = RationalVector(f(3, 5), f(1, 4), f(-1, 6))
+
+    assert (a + b).values == [x + y for x, y in zip(a.values, b.values)]
+    assert (a - b).values == [x - y for x, y in zip(a.values, b.values)]
+    assert (a / f(3, 8)).values == [x / f(3, 8) for x in a.values]
+    assert a.dot(b) == sum(x * y for x, y in zip(a.values, b.values))
+    assert (a + RationalVector(1)).values == [f(3, 2), f(-2, 3), f(5, 7)]
+
+
+def test_is_parralel():
+    a = RationalVector(f(1, 2), 0, f(-2, 3))
+
+    assert a.is_parralel(a * f(-7, 5))
+    assert not a.is_parralel(RationalVector(f(1, 2), 0, f(2, 3)))
+    assert not a.is_parralel(RationalVector(f(1, 2), 1, f(-2, 3)))
+    assert not a.is_parralel(RationalVector(0, 0, 0))
+
+
+def test_generic_vector_compatibility():
+    a = RationalVector(f(1, 2), f(1, 3))
+    generic = GenericVector(f(0), f(1, 2), f(1, 3))
+
+    assert isinstance(a, GenericVector)
+    assert a == RationalVector.from_numerators([6, 4], 12)
+    assert a == generic
+    assert a.dot(generic) == f(13, 36)
+    assert a.is_orthogonal(RationalVector(f(2, 3), -1))
+    assert a.is_parralel(GenericVector(f(0), f(1), f(2, 3)))
+    assert a.is_orthogonal(GenericVector(f(0), f(2, 3), -1))
+
+
+def test_setitem():
+    a = RationalVector(f(1, 2), f(1, 2))
+    a[1] = f(1, 3)
+
+    assert a.values == [f(1, 2), f(1, 3)]
+    assert a.denominator == 6
+
+    a[0:1] = [f(1, 4), 2]
+    assert a.values == [f(1, 4), f(2), f(1, 3)]
+    assert a.denominator == 12
@@ -0,0 +1,134 @@
+import math
+import random
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.rotation import (
+    EULER_ORDERS,
+    angular_distance,
+    batch_from_axis_angle,
+    batch_from_euler,
+    batch_to_axis_angle,
+    batch_to_euler,
+    from_axis_angle,
+    from_euler,
+    slerp,
+    to_axis_angle,
+    to_euler,
+)
+
+float_persition = 0.1**9
+
+
+def same_rotation(q1: Quaternion, q2: Quaternion):
+    dot = q1.r * q2.r + q1.i * q2.i + q1.j * q2.j + q1.k * q2.k
+    return abs(abs(dot) - 1) < float_persition
+
+
+def axis_rotation(axis: str, angle: float) -> Quaternion:
+    values = [0.0, 0.0, 0.0]
+    values["xyz".index(axis)] = math.sin(angle / 2)
+    return Quaternion(math.cos(angle / 2), *values)
+
+
+@pytest.mark.parametrize("order", EULER_ORDERS)
+def test_from_euler(order):
+    angles = (0.3, -1.1, 2.5)
+    first, second, third = (axis_rotation(a, v) for a, v in zip(order, angles))
+
+    assert same_rotation(from_euler(angles, order), third * second * first)
+    assert same_rotation(
+        from_euler(angles, order, intrinsic=True), first * second * third
+    )
+
+
+@pytest.mark.parametrize("order", EULER_ORDERS)
+@pytest.mark.parametrize("intrinsic", [False, True])
+def test_euler_round_trip(order, intrinsic):
+    generator = random.Random(order)
+    angle_sets = [[generator.uniform(-3, 3) for _ in range(3)] for _ in range(20)]
+    # gimbal lock
+    angle_sets += [
+        [0.3, middle, -0.7] for middle in (0, math.pi / 2, -math.pi / 2, math.pi)
+    ]
+
+    for angles in angle_sets:
+        q = from_euler(angles, order, intrinsic)
+        assert same_rotation(
+            from_euler(to_euler(q, order, intrinsic), order, intrinsic), q
+        )
+
+
+@pytest.mark.parametrize("order", ["zxz", "xyx", "yzy"])
+def test_euler_gimbal_lock_at_pi(order):
+    first, second, third = to_euler(from_euler([0.1, math.pi, 0.3], order), order)
+
+    assert abs(second - math.pi) < float_persition
+    assert first == 0.0
+    assert abs(third - 0.2) < float_persition
+
+
+@pytest.mark.parametrize("intrinsic", [False, True])
+def test_batch_euler(intrinsic):
+    columns = ([0.1, 0.2, -3], [0.5, -1.5, 1], [2, 0, 0.25])
+    rotations = batch_from_euler(*columns, "zyx", intrinsic)
+
+    assert rotations == [
+        from_euler(angles, "zyx", intrinsic) for angles in zip(*columns)
+    ]
+
+    for column, expected in zip(batch_to_euler(rotations, "zyx", intrinsic), columns):
+        assert all(abs(a - b) < float_persition for a, b in zip(column, expected))
+
+
+def test_invalid_euler():
+    with pytest.raises(ValueError):
+        from_euler((1, 2, 3), "xxy")
+    with pytest.raises(ValueError):
+        from_euler((1, 2), "xyz")
+    with pytest.raises(ValueError):
+        batch_from_euler([1], [2, 3], [4])
+
+
+def test_axis_angle():
+    axis = Vector(1, 2, 2)
+    q = from_axis_angle(axis, 1.2)
+
+    assert same_rotation(
+        q, Quaternion(math.cos(0.6), *(axis.normalize() * math.sin(0.6)))
+    )
+
+    result_axis, angle = to_axis_angle(q)
+    assert all(
+        abs(a - b) < float_persition for a, b in zip(result_axis, axis.normalize())
+    )
+    assert abs(angle - 1.2) < float_persition
+    assert to_axis_angle(Quaternion(1)) == (Vector(1, 0, 0), 0)
+
+    with pytest.raises(ValueError):
+        from_axis_angle(Vector(0, 0, 0), 1)
+
+
+def test_batch_axis_angle():
+    axes = [Vector(1, 0, 0), Vector(0, 3, 4)]
+    angles = [0.5, -2]
+    rotations = batch_from_axis_angle(axes, angles)
+
+    assert rotations == [from_axis_angle(a, v) for a, v in zip(axes, angles)]
+    assert batch_to_axis_angle(rotations) == tuple(
+        list(column) for column in zip(*(to_axis_angle(q) for q in rotations))
+    )
+
+
+@pytest.mark.parametrize("step", [0.06, 1e-4, 1.5])
+def test_slerp_constant_velocity(step):
+    start = Quaternion(1, 2, -3, 0.5).normalize()
+    end = start * axis_rotation("y", step)
+
+    for t in (0.1, 0.25, 0.5, 0.9):
+        expected = start * axis_rotation("y", t * step)
+        assert angular_distance(slerp(start, end, t), expected) < 1e-12
+        # -end is the same rotation
+        assert angular_distance(slerp(start, -end, t), expected) < 1e-12
+
+    assert slerp(start, start, 0.5) == start
@@ -0,0 +1,73 @@
+import math
+import pytest
+from array import array
+from ...py_math_omm.sampling import Sampler
+
+float_persition = 0.1**9
+
+
+def test_reproducible():
+    assert Sampler(7).unit_quaternions(5) == Sampler(7).unit_quaternions(5)
+    assert Sampler(7).unit_quaternions(5) != Sampler(8).unit_quaternions(5)
+    assert Sampler(7, 1).gaussian_vectors(5) != Sampler(7).gaussian_vectors(5)
+
+
+def test_spawn():
+    workers = Sampler(3).spawn(3)
+    samples = [worker.unit_sphere_vectors(4) for worker in workers]
+
+    assert samples == [worker.unit_sphere_vectors(4) for worker in Sampler(3).spawn(3)]
+    assert samples[0] != samples[1]
+    assert [w.stream for w in workers[0].spawn(2)] == ["0.0.0", "0.0.1"]
+
+
+def test_unit_quaternions():
+    quaternions = Sampler(1).unit_quaternions(4000)
+
+    assert all(abs(abs(q) - 1) < float_persition for q in quaternions)
+    # for uniform rotations every component has a mean of 0 and a variance of 1 / 4
+    for component in ("r", "i", "j", "k"):
+        values = [getattr(q, component) for q in quaternions]
+        assert abs(sum(values) / len(values)) < 0.05
+        assert abs(sum(v * v for v in values) / len(values) - 0.25) < 0.03
+
+
+def test_vectors():
+    sampler = Sampler(2)
+
+    sphere = sampler.unit_sphere_vectors(100, 5)
+    assert all(v.length == 5 and abs(abs(v) - 1) < float_persition for v in sphere)
+
+    ball = sampler.unit_ball_vectors(2000, 2)
+    assert all(abs(v) <= 1 for v in ball)
+    # half of the area of the unit disk is inside the radius 1 / sqrt(2)
+    inner = sum(1 for v in ball if abs(v) < math.sqrt(0.5))
+    assert abs(inner / len(ball) - 0.5) < 0.05
+
+    gaussian = sampler.gaussian_vectors(2000, 1, mean=3, sigma=2)
+    values = [v[0] for v in gaussian]
+    assert abs(sum(values) / len(values) - 3) < 0.2
+
+
+def test_fill_storage():
+    storage = array("d", bytes(8 * 4 * 10))
+    Sampler(5).fill_unit_quaternions(storage, 10)
+
+    expected = Sampler(5).unit_quaternions(10)
+    assert list(storage) == [v for q in expected for v in (q.r, q.i, q.j, q.k)]
+
+    with pytest.raises(ValueError):
+        Sampler(5).fill_unit_sphere(storage, 20, 3)
+
+
+def test_chunks():
+    chunks = list(Sampler(4).iter_unit_quaternions(10, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert sum(chunks, []) == Sampler(4).unit_quaternions(10)
+
+
+def test_ball_chunks():
+    chunks = list(Sampler(4).iter_unit_ball_vectors(10, chunk_size=4))
+
+    assert sum(chunks, []) == Sampler(4).unit_ball_vectors(10)
@@ -0,0 +1,153 @@
+import asyncio
+import math
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.streaming import (
+    Pipeline,
+    filter_items,
+    interpolate,
+    normalize,
+    quaternion_codec,
+    read_batches,
+    rotate,
+    vector_codec,
+)
+
+quaternions = [Quaternion(i, 1, -i, 2) for i in range(10)]
+
+
+def memory_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def test_codec():
+    data = quaternion_codec.encode_many(quaternions)
+
+    assert len(data) == 32 * len(quaternions)
+    assert quaternion_codec.decode_many(data) == quaternions
+
+
+def test_read_batches():
+    async def read():
+        reader = memory_reader(quaternion_codec.encode_many(quaternions))
+        return [batch async for batch in read_batches(reader, quaternion_codec, 4)]
+
+    batches = asyncio.run(read())
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert sum(batches, []) == quaternions
+
+
+def test_read_batches_latency():
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(quaternion_codec.encode_many(quaternions[:3]))
+        batches = read_batches(reader, quaternion_codec, 100, max_latency=0.01)
+        first = await asyncio.wait_for(anext(batches), 1)
+        reader.feed_data(quaternion_codec.encode_many(quaternions[3:]))
+        reader.feed_eof()
+        return first, [batch async for batch in batches]
+
+    first, rest = asyncio.run(read())
+    assert first == quaternions[:3]
+    assert sum(rest, []) == quaternions[3:]
+
+
+def test_incomplete_record():
+    async def run():
+        reader = memory_reader(quaternion_codec.encode_many(quaternions)[:-1])
+        await Pipeline(quaternion_codec).run(reader, lambda batch: asyncio.sleep(0))
+
+    with pytest.raises(asyncio.IncompleteReadError):
+        asyncio.run(run())
+
+
+def test_pipeline_stages():
+    rotation = Quaternion(math.cos(0.5), 0, 0, math.sin(0.5))
+    results = []
+
+    async def sink(batch):
+        await asyncio.sleep(0)
+        results.extend(batch)
+
+    pipeline = Pipeline(
+        quaternion_codec,
+        [filter_items(lambda q: q.r % 2 == 0), normalize, rotate(rotation)],
+        batch_size=3,
+        queue_size=1,
+    )
+
+    async def run():
+        reader = memory_reader(quaternion_codec.encode_many(quaternions))
+        return await pipeline.run(reader, sink)
+
+    assert asyncio.run(run()) == 5
+    assert results == [rotation * q.normalize() for q in quaternions[::2]]
+
+
+def test_interpolate():
+    stage = interpolate(2)
+    first = Quaternion(1)
+    second = Quaternion(0, 0, 0, 1)
+
+    assert stage([first]) == [first]
+    middle, end = stage([second])
+    assert end == second
+    assert abs(middle.r - math.sqrt(0.5)) < 0.1**9
+    assert abs(middle.k - math.sqrt(0.5)) < 0.1**9
+
+    stage.reset()
+    assert stage([first]) == [first]
+
+
+def test_reused_pipeline_resets_stages():
+    first = Quaternion(1)
+    second = Quaternion(0, 0, 0, 1)
+    pipeline = Pipeline(quaternion_codec, [interpolate(2)])
+    results = []
+
+    async def sink(batch):
+        results.extend(batch)
+
+    async def run(stream):
+        reader = memory_reader(quaternion_codec.encode_many(stream))
+        return await pipeline.run(reader, sink)
+
+    assert asyncio.run(run([first])) == 1
+    assert asyncio.run(run([second])) == 1
+    assert results == [first, second]
+
+
+def test_socket_stream():
+    codec = vector_codec(3)
+    vectors = [Vector(i, 2 * i, 3 * i) for i in range(50)]
+    results = []
+
+    async def sink(batch):
+        results.extend(batch)
+
+    async def run():
+        async def handle(reader, writer):
+            await Pipeline(codec, [rotate(Quaternion(1))], batch_size=8).run(
+                reader, sink
+            )
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async with server:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(codec.encode_many(vectors))
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+            while len(results) < len(vectors):
+                await asyncio.sleep(0.01)
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+    assert results == vectors
@@ -0,0 +1,97 @@
+import math
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.rotation import angular_distance, from_axis_angle
+from ...py_math_omm.trajectory import (
+    CompressedTrajectory,
+    TrajectoryCompressor,
+    compress,
+    decode_smallest_three,
+    encode_smallest_three,
+)
+from ...py_math_omm.sampling import Sampler
+
+times = [n / 100 for n in range(500)]
+# spins around z at a changing rate, with a wobble around x
+rotations = [
+    from_axis_angle(Vector(0, 0, 1), 3 * t + math.sin(2 * t))
+    * from_axis_angle(Vector(1, 0, 0), 0.3 * math.sin(5 * t))
+    for t in times
+]
+
+
+def max_error(trajectory: CompressedTrajectory) -> float:
+    return max(
+        angular_distance(trajectory.sample(t), q) for t, q in zip(times, rotations)
+    )
+
+
+def test_constant_rotation_rate():
+    spin = [from_axis_angle(Vector(0, 1, 0), 0.5 * t) for t in times]
+    trajectory = compress(times, spin, 1e-6)
+
+    assert trajectory.times == [times[0], times[-1]]
+
+
+def test_long_constant_rotation_rate():
+    # a slerp covers at most half a turn, so 20 radians need at least 7 segments
+    long_times = [n / 100 for n in range(20000)]
+    spin = [from_axis_angle(Vector(1, 1, 0), 0.1 * t) for t in long_times]
+    trajectory = compress(long_times, spin, 1e-6)
+
+    assert len(trajectory) <= 10
+    assert all(
+        angular_distance(trajectory.sample(t), q) <= 1e-6
+        for t, q in zip(long_times[::97], spin[::97])
+    )
+
+
+@pytest.mark.parametrize("error,ratio", [(0.01, 10), (0.001, 3)])
+def test_error_bound(error, ratio):
+    trajectory = compress(times, rotations, error)
+
+    assert len(trajectory) * ratio < len(times)
+    assert max_error(trajectory) <= error + 1e-12
+
+
+def test_online_matches_offline():
+    compressor = TrajectoryCompressor(0.01)
+    keyframes = []
+    for t, q in zip(times, rotations):
+        keyframes.extend(compressor.push(t, q))
+    keyframes.extend(compressor.finish())
+
+    trajectory = compress(times, rotations, 0.01)
+    assert [t for t, _ in keyframes] == trajectory.times
+
+
+def test_sample_clamps():
+    trajectory = compress(times, rotations, 0.01)
+
+    assert trajectory.sample(-1) == rotations[0]
+    assert trajectory.sample(100) == rotations[-1]
+    assert trajectory.resample([0, times[-1]]) == [rotations[0], rotations[-1]]
+
+
+def test_smallest_three():
+    for q in Sampler(21).unit_quaternions(200):
+        code = encode_smallest_three(q, 12)
+        assert code < 1 << 38
+        assert angular_distance(decode_smallest_three(code, 12), q) < 1e-3
+
+
+def test_quantized():
+    trajectory = compress(times, rotations, 0.01, quantization_bits=15)
+
+    assert max_error(trajectory) <= 0.01 + 1e-12
+    decoded = CompressedTrajectory.from_codes(trajectory.times, trajectory.codes)
+    assert decoded.rotations == trajectory.rotations
+
+    with pytest.raises(ValueError):
+        compress(times, rotations, 1e-6, quantization_bits=6)
+
+
+def test_invalid_times():
+    with pytest.raises(ValueError):
+        compress([0, 1, 1], [Quaternion(1)] * 3, 0.1)
@@ -0,0 +1,84 @@
+import math
+import pytest
+from ...py_math_omm.quaternion import Quaternion
+from ...py_math_omm.vector import Vector
+from ...py_math_omm.rotation import rotate_vector
+from ...py_math_omm.transform_tree import TransformTree
+
+float_persition = 0.1**9
+
+
+def vectors_equal(v1: Vector, v2: Vector):
+    return all(abs(a - b) < float_persition for a, b in zip(v1, v2))
+
+
+def z_rotation(angle: float) -> Quaternion:
+    return Quaternion(math.cos(angle / 2), 0, 0, math.sin(angle / 2))
+
+
+def test_rotate_vector():
+    q = Quaternion(1, 2, -3, 0.5).normalize()
+    v = Vector(1, -2, 3)
+    expected = q * Quaternion(0, *v) * q.conjugate()
+
+    assert vectors_equal(
+        rotate_vector(q, v), Vector(expected.i, expected.j, expected.k)
+    )
+
+
+def make_arm():
+    tree = TransformTree()
+    root = tree.add_node(z_rotation(math.pi / 2), Vector(1, 0, 0))
+    elbow = tree.add_node(z_rotation(math.pi / 2), Vector(2, 0, 0), parent=root)
+    hand = tree.add_node(translation=Vector(3, 0, 0), parent=elbow)
+    other = tree.add_node(translation=Vector(0, 0, 1), parent=root)
+    return tree, root, elbow, hand, other
+
+
+def test_world_transform():
+    tree, root, elbow, hand, other = make_arm()
+
+    rotation, translation = tree.world_transform(hand)
+    assert vectors_equal(translation, Vector(-2, 2, 0))
+    assert vectors_equal(rotate_vector(rotation, Vector(1, 0, 0)), Vector(-1, 0, 0))
+    assert vectors_equal(tree.world_transform(other)[1], Vector(1, 0, 1))
+
+
+def test_returned_translations_are_copies():
+    tree, root, elbow, hand, other = make_arm()
+
+    tree.world_transform(root)[1][0] = 10
+    tree.local_transform(root)[1][0] = 10
+
+    assert vectors_equal(tree.world_transform(root)[1], Vector(1, 0, 0))
+    assert vectors_equal(tree.local_transform(root)[1], Vector(1, 0, 0))
+
+
+def test_incremental_update():
+    tree, root, elbow, hand, other = make_arm()
+    tree.update()
+
+    tree.set_local(elbow, rotation=Quaternion(1))
+
+    assert tree.is_dirty(elbow) and tree.is_dirty(hand)
+    assert not tree.is_dirty(root) and not tree.is_dirty(other)
+    assert vectors_equal(tree.world_transform(hand)[1], Vector(1, 5, 0))
+    assert not tree.is_dirty(elbow)
+
+
+def test_transform_points():
+    tree, root, elbow, hand, other = make_arm()
+
+    points = tree.transform_points(hand, [Vector(0, 0, 0), Vector(1, 0, 0)])
+    assert vectors_equal(points[0], Vector(-2, 2, 0))
+    assert vectors_equal(points[1], Vector(-3, 2, 0))
+
+
+def test_invalid_nodes():
+    tree = TransformTree()
+
+    with pytest.raises(IndexError):
+        tree.add_node(parent=0)
+    with pytest.raises(ValueError):
+        tree.add_node(translation=Vector(1, 2))
+    assert len(tree) == 0
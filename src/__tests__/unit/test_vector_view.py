@@ -0,0 +1,100 @@
+import math
+from ...py_math_omm.vector import Vector, VectorView
+
+
+def make_vector():
+    return Vector(0, 1, 2, 3, 4, 5, 6, 7)
+
+
+def test_view_values():
+    vec = make_vector()
+    view = vec.view(1, 7, 2)
+
+    assert isinstance(view, VectorView)
+    assert view.length == 3
+    assert list(view) == [1, 3, 5]
+    assert view[-1] == 5
+    assert view[0:2] == [1, 3]
+
+
+def test_view_of_view():
+    vec = make_vector()
+    view = vec.view(step=2).view(1)
+
+    assert list(view) == [2, 4, 6]
+
+    view[0] = 20
+    assert vec[2] == 20
+
+
+def test_view_write_through():
+    vec = make_vector()
+    view = vec.view(0, 4)
+
+    view[1] = 10
+    view[2:4] = [20, 30]
+
+    assert vec == Vector(0, 10, 20, 30, 4, 5, 6, 7)
+
+
+def test_view_operations():
+    vec = make_vector()
+    view = vec.view(2, 4)
+
+    assert view.dot(Vector(1, 1)) == 5
+    assert abs(view) == math.sqrt(13)
+    assert view + Vector(1, 1) == Vector(3, 4)
+    assert view == Vector(2, 3)
+    assert view.copy() == Vector(2, 3)
+
+
+def test_view_in_place():
+    vec = make_vector()
+    view = vec.view(0, 8, 4)
+
+    view += Vector(1, 1)
+    assert list(vec) == [1, 1, 2, 3, 5, 5, 6, 7]
+
+    view *= 2
+    assert vec[0] == 2 and vec[4] == 10
+
+    view -= Vector(2, 10)
+    assert vec[0] == 0 and vec[4] == 0
+
+
+def test_overlapping_views_in_place():
+    vec = Vector(1, 2, 3)
+    view = vec.view(1, 3)
+    view += vec.view(0, 2)
+    assert vec == Vector(1, 3, 5)
+
+    vec = Vector(1, 2, 3)
+    view = vec.view(1, 3)
+    view -= vec.view(0, 2)
+    assert vec == Vector(1, 1, 1)
+
+    vec = Vector(1, 2)
+    view = vec.view()
+    view += vec
+    assert vec == Vector(2, 4)
+
+
+def test_vector_in_place_creates_new_vector():
+    a = Vector(1)
+    b = a
+    a += Vector(1, 2)
+
+    assert a == Vector(2, 2)
+    assert b == Vector(1)
+
+
+def test_normalize_into():
+    vec = Vector(3, 4, 0, 0)
+    view = vec.view(2)
+
+    Vector(0, 5).normalize_into(view)
+    assert vec == Vector(3, 4, 0, 1)
+
+    vec.view(0, 2).normalize_into()
+    assert math.isclose(vec[0], 0.6) and math.isclose(vec[1], 0.8)
+    assert abs(vec.view(0, 2)) == 1
@@ -1,2 +1,63 @@
-from .quaternion import Quaternion
-from .vector import Vector
\ No newline at end of file
+"""the public names are loaded on first access (PEP 562), so importing the package does not import the subsystems"""
+
+import importlib
+
+# public name -> submodule that defines it
+_lazy_names: dict[str, str] = {
+    "Quaternion": "quaternion",
+    "Vector": "vector",
+    "VectorView": "vector",
+    "GenericVector": "generic_vector",
+    "RationalVector": "rational_vector",
+    "CompositionIndex": "composition_index",
+    "TransformTree": "transform_tree",
+    "DualQuaternion": "dual_quaternion",
+    "Sampler": "sampling",
+    "OrientationIndex": "orientation_index",
+    "CompressedTrajectory": "trajectory",
+    "TrajectoryCompressor": "trajectory",
+    "Pipeline": "streaming",
+}
+
+_submodules: frozenset[str] = frozenset(
+    {
+        "composition_index",
+        "dual_quaternion",
+        "generic_vector",
+        "integration",
+        "kernels",
+        "orientation_index",
+        "orthonormalize",
+        "pairwise",
+        "quaternion",
+        "quaternion_batch",
+        "rational_vector",
+        "rotation",
+        "sampling",
+        "streaming",
+        "trajectory",
+        "transform_tree",
+        "types",
+        "vector",
+    }
+)
+
+__all__ = sorted(_lazy_names)
+
+
+def __getattr__(name: str) -> object:
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _lazy_names.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # later accesses find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _submodules)
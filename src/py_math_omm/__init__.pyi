@@ -0,0 +1,16 @@
+from .quaternion import Quaternion as Quaternion
+from .vector import Vector as Vector, VectorView as VectorView
+from .generic_vector import GenericVector as GenericVector
+from .rational_vector import RationalVector as RationalVector
+from .composition_index import CompositionIndex as CompositionIndex
+from .transform_tree import TransformTree as TransformTree
+from .dual_quaternion import DualQuaternion as DualQuaternion
+from .sampling import Sampler as Sampler
+from .orientation_index import OrientationIndex as OrientationIndex
+from .trajectory import (
+    CompressedTrajectory as CompressedTrajectory,
+    TrajectoryCompressor as TrajectoryCompressor,
+)
+from .streaming import Pipeline as Pipeline
+
+__all__: list[str]
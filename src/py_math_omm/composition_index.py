@@ -0,0 +1,97 @@
+from typing import Iterable
+from .types import withNone
+from .quaternion import Quaternion
+
+
+class CompositionIndex:
+    """a segment tree over a sequence of quaternions, answering ordered range products in O(log n)
+
+    the product of the range [start, stop) is q[start] * q[start + 1] * ... * q[stop - 1]
+    """
+
+    def __init__(self, quaternions: Iterable[Quaternion] = ()) -> None:
+        leaves = list(quaternions)
+        self._length = len(leaves)
+
+        size = 1
+        while size < self._length:
+            size *= 2
+        self._size = size
+
+        identity = Quaternion(1)
+        # the root is tree[1], the children of tree[n] are tree[2n] and tree[2n + 1]
+        self._tree = [identity] * size + leaves + [identity] * (size - self._length)
+
+        for node in range(size - 1, 0, -1):
+            self._tree[node] = self._tree[2 * node] * self._tree[2 * node + 1]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _leaf(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("composition index out of range")
+
+        return index + self._size
+
+    def __getitem__(self, index: int) -> Quaternion:
+        return self._tree[self._leaf(index)]
+
+    def __setitem__(self, index: int, quaternion: Quaternion) -> None:
+        self.update(index, quaternion)
+
+    def update(self, index: int, quaternion: Quaternion) -> None:
+        """replaces the quaternion at index and recomputes the O(log n) products that contain it"""
+        tree = self._tree
+        node = self._leaf(index)
+        tree[node] = quaternion
+        node //= 2
+
+        while node:
+            tree[node] = tree[2 * node] * tree[2 * node + 1]
+            node //= 2
+
+    def product(self, start: int = 0, stop: withNone[int] = None) -> Quaternion:
+        """computes the ordered product of the quaternions in [start, stop)
+
+        Args:
+            start (int, optional): first index of the range. Defaults to 0.
+            stop (withNone[int], optional): index after the end of the range, the length when None. Defaults to None.
+
+        Raises:
+            IndexError: when the range is not inside the sequence
+            ValueError: when start > stop
+
+        Returns:
+            Quaternion: the product, the identity quaternion for an empty range
+        """
+        if stop is None:
+            stop = self._length
+
+        if not (0 <= start <= self._length and 0 <= stop <= self._length):
+            raise IndexError("composition index range out of range")
+
+        if start > stop:
+            raise ValueError("start of range is after its stop")
+
+        tree = self._tree
+        left = Quaternion(1)
+        right = Quaternion(1)
+        low = start + self._size
+        high = stop + self._size
+
+        # the left and right products are kept apart because multiplication is not commutative
+        while low < high:
+            if low & 1:
+                left = left * tree[low]
+                low += 1
+            if high & 1:
+                high -= 1
+                right = tree[high] * right
+            low //= 2
+            high //= 2
+
+        return left * right
@@ -0,0 +1,217 @@
+import math
+from typing import Iterable
+from .types import withNone, real_number
+from .quaternion import Quaternion
+from .vector import Vector
+from .rotation import transform_points
+
+
+class DualQuaternion:
+    """a dual quaternion real + eps * dual (eps^2 = 0), used to represent rigid transforms
+
+    a unit dual quaternion holds a rotation in its real part and the translation t in its
+    dual part as 0.5 * t * real
+    """
+
+    def __init__(
+        self, real: withNone[Quaternion] = None, dual: withNone[Quaternion] = None
+    ) -> None:
+        self.real = Quaternion(1) if real is None else real
+        self.dual = Quaternion() if dual is None else dual
+
+    @classmethod
+    def from_rotation_translation(
+        cls,
+        rotation: withNone[Quaternion] = None,
+        translation: withNone[Vector] = None,
+    ) -> "DualQuaternion":
+        """creates the transform that rotates and then translates
+
+        Args:
+            rotation (withNone[Quaternion], optional): a unit quaternion, the identity when None. Defaults to None.
+            translation (withNone[Vector], optional): a 3 dimensional translation, no translation when None. Defaults to None.
+
+        Raises:
+            ValueError: when translation is not 3 dimensional
+
+        Returns:
+            DualQuaternion: the transform
+        """
+        if rotation is None:
+            rotation = Quaternion(1)
+
+        if translation is None:
+            return cls(rotation, Quaternion())
+
+        if translation.length != 3:
+            raise ValueError("translations must be 3 dimensional")
+
+        x, y, z = translation.values
+        return cls(rotation, Quaternion(0, x, y, z) * rotation * 0.5)
+
+    @property
+    def rotation(self) -> Quaternion:
+        return self.real
+
+    @property
+    def translation(self) -> Vector:
+        t = self.dual * self.real.conjugate() * 2
+        return Vector(t.i, t.j, t.k)
+
+    def conjugate(self) -> "DualQuaternion":
+        return DualQuaternion(self.real.conjugate(), self.dual.conjugate())
+
+    def inverse(self) -> "DualQuaternion":
+        real_inverse = self.real.inverse()
+        return DualQuaternion(real_inverse, -(real_inverse * self.dual * real_inverse))
+
+    def normalize(self) -> "DualQuaternion":
+        """scales self into a unit dual quaternion, which represents a rigid transform"""
+        norm = abs(self.real)
+        real = self.real / norm
+        dual = self.dual / norm
+        # a unit dual quaternion has a dual part orthogonal to its real part
+        overlap = real.r * dual.r + real.i * dual.i + real.j * dual.j + real.k * dual.k
+        return DualQuaternion(real, dual - real * overlap)
+
+    def transform_point(self, point: Vector) -> Vector:
+        """rotates then translates point
+
+        Raises:
+            ValueError: when point is not 3 dimensional
+        """
+        return self.transform_points((point,))[0]
+
+    def transform_points(self, points: Iterable[Vector]) -> list[Vector]:
+        """rotates then translates every point, sharing the rotation matrix between them
+
+        Raises:
+            ValueError: when one of the points is not 3 dimensional
+        """
+        return transform_points(self.real, self.translation, points)
+
+    def sclerp(self, other: "DualQuaternion", t: real_number) -> "DualQuaternion":
+        """screw linear interpolation from self (t = 0) to other (t = 1), both unit dual quaternions"""
+        difference = self.conjugate() * other
+
+        # q and -q are the same transform, take the shorter screw motion
+        if difference.real.r < 0:
+            difference = -difference
+
+        return self * difference**t
+
+    def __mul__(self, other: "DualQuaternion | real_number") -> "DualQuaternion":
+        # composing: (self * other) applies other first and then self
+        if isinstance(other, DualQuaternion):
+            return DualQuaternion(
+                self.real * other.real,
+                self.real * other.dual + self.dual * other.real,
+            )
+        if isinstance(other, (int, float)):
+            return DualQuaternion(self.real * other, self.dual * other)
+        return NotImplemented
+
+    def __rmul__(self, other: real_number) -> "DualQuaternion":
+        if isinstance(other, (int, float)):
+            return self * other
+        return NotImplemented
+
+    def __add__(self, other: "DualQuaternion") -> "DualQuaternion":
+        if not isinstance(other, DualQuaternion):
+            return NotImplemented
+        return DualQuaternion(self.real + other.real, self.dual + other.dual)
+
+    def __sub__(self, other: "DualQuaternion") -> "DualQuaternion":
+        if not isinstance(other, DualQuaternion):
+            return NotImplemented
+        return DualQuaternion(self.real - other.real, self.dual - other.dual)
+
+    def __neg__(self) -> "DualQuaternion":
+        return DualQuaternion(-self.real, -self.dual)
+
+    def __pow__(self, t: real_number) -> "DualQuaternion":
+        """raises a unit dual quaternion to a real power along its screw axis"""
+        if not isinstance(t, (int, float)):
+            return NotImplemented
+
+        w, x, y, z = self.real.r, self.real.i, self.real.j, self.real.k
+        sin_half = math.sqrt(x * x + y * y + z * z)
+
+        if sin_half < 1e-12:
+            # no rotation, only the translation is scaled
+            return DualQuaternion(self.real**t, self.dual * t)
+
+        # screw parameters: angle, axis direction, pitch (translation along the axis) and moment
+        angle = 2 * math.atan2(sin_half, w)
+        lx, ly, lz = x / sin_half, y / sin_half, z / sin_half
+        pitch = -2 * self.dual.r / sin_half
+        half_pitch_cos = pitch / 2 * w
+        mx = (self.dual.i - lx * half_pitch_cos) / sin_half
+        my = (self.dual.j - ly * half_pitch_cos) / sin_half
+        mz = (self.dual.k - lz * half_pitch_cos) / sin_half
+
+        angle *= t
+        pitch *= t
+        new_sin = math.sin(angle / 2)
+        new_cos = math.cos(angle / 2)
+        half_pitch_cos = pitch / 2 * new_cos
+
+        return DualQuaternion(
+            Quaternion(new_cos, lx * new_sin, ly * new_sin, lz * new_sin),
+            Quaternion(
+                -pitch / 2 * new_sin,
+                mx * new_sin + lx * half_pitch_cos,
+                my * new_sin + ly * half_pitch_cos,
+                mz * new_sin + lz * half_pitch_cos,
+            ),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DualQuaternion):
+            return NotImplemented
+        return self.real == other.real and self.dual == other.dual
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __str__(self) -> str:
+        return f"DualQuaternion(real = {self.real}, dual = {self.dual})"
+
+    def __repr__(self) -> str:
+        return f"DualQuaternion({self.real!r}, {self.dual!r})"
+
+
+def compose_batch(
+    lefts: Iterable[DualQuaternion], rights: Iterable[DualQuaternion]
+) -> list[DualQuaternion]:
+    """composes the transforms pairwise, left * right for every pair
+
+    Raises:
+        ValueError: when there is a different number of lefts and rights
+    """
+    lefts = list(lefts)
+    rights = list(rights)
+
+    if len(lefts) != len(rights):
+        raise ValueError("expected the same number of transforms on both sides")
+
+    return [left * right for left, right in zip(lefts, rights)]
+
+
+def transform_batch(
+    transforms: Iterable[DualQuaternion], points: Iterable[Vector]
+) -> list[Vector]:
+    """transforms every point by the transform in the same position
+
+    Raises:
+        ValueError: when there is a different number of transforms and points, or a point is not 3 dimensional
+    """
+    transforms = list(transforms)
+    points = list(points)
+
+    if len(transforms) != len(points):
+        raise ValueError("expected one transform per point")
+
+    return [
+        transform.transform_point(point) for transform, point in zip(transforms, points)
+    ]
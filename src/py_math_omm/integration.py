@@ -0,0 +1,195 @@
+import math
+from typing import Callable, Sequence
+from .quaternion import Quaternion
+from .vector import Vector
+
+type _Step = Callable[
+    [float, float, float, float, float, float, float, float, bool],
+    tuple[float, float, float, float],
+]
+
+
+def _derivative(
+    wx: float,
+    wy: float,
+    wz: float,
+    r: float,
+    i: float,
+    j: float,
+    k: float,
+    body_frame: bool,
+) -> tuple[float, float, float, float]:
+    # dq/dt = 0.5 * w * q for a world frame w, 0.5 * q * w for a body frame w
+    if body_frame:
+        return (
+            0.5 * (-i * wx - j * wy - k * wz),
+            0.5 * (r * wx + j * wz - k * wy),
+            0.5 * (r * wy - i * wz + k * wx),
+            0.5 * (r * wz + i * wy - j * wx),
+        )
+    return (
+        0.5 * (-wx * i - wy * j - wz * k),
+        0.5 * (wx * r + wy * k - wz * j),
+        0.5 * (-wx * k + wy * r + wz * i),
+        0.5 * (wx * j - wy * i + wz * r),
+    )
+
+
+def _exp_step(
+    wx: float,
+    wy: float,
+    wz: float,
+    r: float,
+    i: float,
+    j: float,
+    k: float,
+    dt: float,
+    body_frame: bool,
+) -> tuple[float, float, float, float]:
+    # q(t + dt) = exp(0.5 * dt * w) * q(t), or q(t) * exp(0.5 * dt * w) in the body frame
+    half_dt = dt / 2
+    angle = half_dt * math.sqrt(wx * wx + wy * wy + wz * wz)
+    if abs(angle) < 1e-4:
+        # Taylor series of sin(angle) / angle, avoids dividing by ~0
+        factor = half_dt * (1 - angle * angle / 6)
+    else:
+        factor = half_dt * math.sin(angle) / angle
+    c = math.cos(angle)
+    x, y, z = wx * factor, wy * factor, wz * factor
+
+    if body_frame:
+        return (
+            r * c - i * x - j * y - k * z,
+            r * x + i * c + j * z - k * y,
+            r * y - i * z + j * c + k * x,
+            r * z + i * y - j * x + k * c,
+        )
+    return (
+        c * r - x * i - y * j - z * k,
+        c * i + x * r + y * k - z * j,
+        c * j - x * k + y * r + z * i,
+        c * k + x * j - y * i + z * r,
+    )
+
+
+def _euler_step(
+    wx: float,
+    wy: float,
+    wz: float,
+    r: float,
+    i: float,
+    j: float,
+    k: float,
+    dt: float,
+    body_frame: bool,
+) -> tuple[float, float, float, float]:
+    dr, di, dj, dk = _derivative(wx, wy, wz, r, i, j, k, body_frame)
+    return r + dt * dr, i + dt * di, j + dt * dj, k + dt * dk
+
+
+def _rk4_step(
+    wx: float,
+    wy: float,
+    wz: float,
+    r: float,
+    i: float,
+    j: float,
+    k: float,
+    dt: float,
+    body_frame: bool,
+) -> tuple[float, float, float, float]:
+    half_dt = dt / 2
+    r1, i1, j1, k1 = _derivative(wx, wy, wz, r, i, j, k, body_frame)
+    r2, i2, j2, k2 = _derivative(
+        wx,
+        wy,
+        wz,
+        r + half_dt * r1,
+        i + half_dt * i1,
+        j + half_dt * j1,
+        k + half_dt * k1,
+        body_frame,
+    )
+    r3, i3, j3, k3 = _derivative(
+        wx,
+        wy,
+        wz,
+        r + half_dt * r2,
+        i + half_dt * i2,
+        j + half_dt * j2,
+        k + half_dt * k2,
+        body_frame,
+    )
+    r4, i4, j4, k4 = _derivative(
+        wx,
+        wy,
+        wz,
+        r + dt * r3,
+        i + dt * i3,
+        j + dt * j3,
+        k + dt * k3,
+        body_frame,
+    )
+    sixth_dt = dt / 6
+    return (
+        r + sixth_dt * (r1 + 2 * r2 + 2 * r3 + r4),
+        i + sixth_dt * (i1 + 2 * i2 + 2 * i3 + i4),
+        j + sixth_dt * (j1 + 2 * j2 + 2 * j3 + j4),
+        k + sixth_dt * (k1 + 2 * k2 + 2 * k3 + k4),
+    )
+
+
+_steps: dict[str, _Step] = {
+    "euler": _euler_step,
+    "exp": _exp_step,
+    "rk4": _rk4_step,
+}
+
+INTEGRATION_METHODS = tuple(_steps)
+
+
+def integrate(
+    orientations: Sequence[Quaternion],
+    angular_velocities: Sequence[Vector],
+    dt: float,
+    method: str = "exp",
+    body_frame: bool = False,
+    normalize: bool = True,
+) -> None:
+    """advances the orientation of every body by dt, in place, assuming a constant angular velocity during the step
+
+    Args:
+        orientations (Sequence[Quaternion]): the unit quaternion orientation of each body, updated in place
+        angular_velocities (Sequence[Vector]): the 3 dimensional angular velocity of each body, in radians per unit of time
+        dt (float): the time step
+        method (str, optional): "euler" (first order), "exp" (the exponential map, exact for a constant angular velocity) or "rk4". Defaults to "exp".
+        body_frame (bool, optional): the angular velocities are given in the frame of the body instead of the world frame. Defaults to False.
+        normalize (bool, optional): renormalizes the orientations after the step. Defaults to True.
+
+    Raises:
+        ValueError: when method is unknown, there is a different number of orientations and angular velocities or an angular velocity is not 3 dimensional
+    """
+    step = _steps.get(method)
+    if step is None:
+        raise ValueError(
+            f"unknown integration method {method!r}, expected one of {INTEGRATION_METHODS}"
+        )
+
+    if len(orientations) != len(angular_velocities):
+        raise ValueError("expected one angular velocity per orientation")
+
+    # checked before any orientation is changed, so a bad velocity leaves them all unchanged
+    if any(velocity.length != 3 for velocity in angular_velocities):
+        raise ValueError("angular velocities must be 3 dimensional")
+
+    sqrt = math.sqrt
+
+    for q, velocity in zip(orientations, angular_velocities):
+        wx, wy, wz = velocity.values
+        r, i, j, k = step(wx, wy, wz, q.r, q.i, q.j, q.k, dt, body_frame)
+
+        if normalize:
+            norm = sqrt(r * r + i * i + j * j + k * k)
+            r, i, j, k = r / norm, i / norm, j / norm, k / norm
+
+        q.r, q.i, q.j, q.k = r, i, j, k
@@ -0,0 +1,156 @@
+from typing import Callable
+from .types import withNone
+
+type Kernel = Callable[..., object]
+
+DEFAULT_MAX_DIMENSION = 64
+
+_max_dimension: int = DEFAULT_MAX_DIMENSION
+_kernels: dict[tuple[str, int], Kernel] = {}
+
+
+def _unpack(name: str, dimension: int) -> str:
+    names = ", ".join(f"{name}{i}" for i in range(dimension))
+    # the trailing comma keeps the 1 dimensional unpacking a tuple unpacking
+    return f"    {names}, = {name}\n"
+
+
+def _dot_source(dimension: int) -> str:
+    # starting from 0 keeps the result identical to the summing loop in Vector.dot
+    terms = " + ".join(f"a{i} * b{i}" for i in range(dimension))
+    return (
+        f"def dot_{dimension}(a, b):\n"
+        + _unpack("a", dimension)
+        + _unpack("b", dimension)
+        + f"    return 0 + {terms}\n"
+    )
+
+
+def _add_source(dimension: int) -> str:
+    terms = ", ".join(f"a{i} + b{i}" for i in range(dimension))
+    return (
+        f"def add_{dimension}(a, b):\n"
+        + _unpack("a", dimension)
+        + _unpack("b", dimension)
+        + f"    return [{terms}]\n"
+    )
+
+
+def _eq_source(dimension: int) -> str:
+    terms = " and ".join(f"a{i} == b{i}" for i in range(dimension))
+    return (
+        f"def eq_{dimension}(a, b):\n"
+        + _unpack("a", dimension)
+        + _unpack("b", dimension)
+        + f"    return {terms}\n"
+    )
+
+
+def _is_parralel_source(dimension: int) -> str:
+    lines = [
+        f"def is_parralel_{dimension}(a, b):\n",
+        _unpack("a", dimension),
+        _unpack("b", dimension),
+        "    factor = None\n",
+    ]
+
+    for i in range(dimension):
+        lines.append(
+            f"    if (a{i} == 0) != (b{i} == 0):\n"
+            f"        return False\n"
+            f"    if a{i} != 0:\n"
+            f"        if factor is None:\n"
+            f"            factor = a{i} / b{i}\n"
+            f"        elif a{i} != factor * b{i}:\n"
+            f"            return False\n"
+        )
+
+    lines.append("    return True\n")
+    return "".join(lines)
+
+
+_generators: dict[str, Callable[[int], str]] = {
+    "dot": _dot_source,
+    "add": _add_source,
+    "eq": _eq_source,
+    "is_parralel": _is_parralel_source,
+}
+
+
+def _generate(operation: str, dimension: int) -> Kernel:
+    source = _generators[operation](dimension)
+    namespace: dict[str, object] = {}
+    code = compile(source, f"<py_math_omm kernel {operation}_{dimension}>", "exec")
+    exec(code, namespace)
+    return namespace[f"{operation}_{dimension}"]
+
+
+def get_kernel(operation: str, dimension: int) -> withNone[Kernel]:
+    """returns the unrolled kernel of operation for vectors of the given dimension, generating it on first use
+
+    Args:
+        operation (str): one of "dot", "add", "eq" and "is_parralel"
+        dimension (int): the length of the vectors the kernel works on
+
+    Raises:
+        ValueError: when operation is unknown
+
+    Returns:
+        withNone[Kernel]: None when dimension is not between 1 and the max dimension, the kernel otherwise
+    """
+    key = (operation, dimension)
+    kernel = _kernels.get(key)
+
+    if kernel is not None:
+        return kernel
+
+    if operation not in _generators:
+        raise ValueError(f"unknown kernel operation {operation!r}")
+
+    if dimension < 1 or dimension > _max_dimension:
+        return None
+
+    kernel = _kernels[key] = _generate(operation, dimension)
+    return kernel
+
+
+def get_max_dimension() -> int:
+    return _max_dimension
+
+
+def set_max_dimension(dimension: int) -> None:
+    """sets the largest dimension kernels are generated for, kernels above it are discarded
+
+    Args:
+        dimension (int): the new max dimension, 0 disables the kernels
+
+    Raises:
+        ValueError: when dimension is negative
+    """
+    global _max_dimension
+
+    if dimension < 0:
+        raise ValueError("max dimension cannot be negative")
+
+    _max_dimension = dimension
+
+    for key in [key for key in _kernels if key[1] > dimension]:
+        del _kernels[key]
+
+
+def clear_kernels() -> None:
+    _kernels.clear()
+
+
+def kernel_stats() -> dict[str, list[int]]:
+    """returns the generated kernels
+
+    Returns:
+        dict[str, list[int]]: maps each operation to the sorted dimensions it was generated for
+    """
+    stats: dict[str, list[int]] = {operation: [] for operation in _generators}
+
+    for operation, dimension in sorted(_kernels):
+        stats[operation].append(dimension)
+
+    return stats
@@ -0,0 +1,162 @@
+import math
+from itertools import product
+from typing import Iterable
+from .types import withNone
+from .quaternion import Quaternion
+from .rotation import angular_distance, canonicalize
+
+type _Cell = tuple[int, int, int, int]
+
+
+def _chord(angle: float) -> float:
+    # two unit quaternions in the same hemisphere whose rotations are angle apart are
+    # 2 * sin(angle / 4) apart in R^4
+    return 2 * math.sin(min(angle, math.pi) / 4)
+
+
+class OrientationIndex:
+    """a spatial hash of rotations for near duplicate and nearest orientation lookups
+
+    the quaternions are canonicalized and hashed into a 4 dimensional grid, a lookup only checks
+    the cells around the query and around its negation
+
+    Args:
+        resolution (float): the angle, in radians, that a cell of the grid spans, queries up to this radius check 2 * 3^4 cells
+    """
+
+    def __init__(self, resolution: float) -> None:
+        if not 0 < resolution <= math.pi:
+            raise ValueError("resolution must be in (0, pi]")
+
+        self.resolution = resolution
+        self._cell_size = _chord(resolution)
+        self._cells: dict[_Cell, list[int]] = {}
+        self._quaternions: list[Quaternion] = []
+        self._payloads: list[object] = []
+
+    def __len__(self) -> int:
+        return len(self._quaternions)
+
+    def __getitem__(self, key: int) -> tuple[Quaternion, object]:
+        return self._quaternions[key], self._payloads[key]
+
+    def _cell(self, q: Quaternion) -> _Cell:
+        size = self._cell_size
+        return (
+            math.floor(q.r / size),
+            math.floor(q.i / size),
+            math.floor(q.j / size),
+            math.floor(q.k / size),
+        )
+
+    def add(self, q: Quaternion, payload: object = None) -> int:
+        """adds the unit quaternion q
+
+        Returns:
+            int: the key of q in the index
+        """
+        q = canonicalize(q)
+        key = len(self._quaternions)
+        self._quaternions.append(q)
+        self._payloads.append(payload)
+        self._cells.setdefault(self._cell(q), []).append(key)
+        return key
+
+    def _candidates(self, q: Quaternion, reach: int) -> set[int]:
+        cells = self._cells
+        candidates: set[int] = set()
+        # stored quaternions are canonical, near the boundary of the canonical hemisphere
+        # the neighbours of q may have been stored as the neighbours of -q
+        centers = (self._cell(q), self._cell(-q))
+
+        if 2 * (2 * reach + 1) ** 4 > len(cells):
+            # there are less occupied cells than cells around the centers
+            for cell, keys in cells.items():
+                for center in centers:
+                    if max(abs(c - o) for c, o in zip(cell, center)) <= reach:
+                        candidates.update(keys)
+                        break
+            return candidates
+
+        offsets = range(-reach, reach + 1)
+        for r, i, j, k in centers:
+            for dr, di, dj, dk in product(offsets, repeat=4):
+                keys = cells.get((r + dr, i + di, j + dj, k + dk))
+                if keys:
+                    candidates.update(keys)
+
+        return candidates
+
+    def within(self, q: Quaternion, radius: withNone[float] = None) -> list[int]:
+        """finds the stored rotations at most radius radians from q
+
+        Args:
+            q (Quaternion): a unit quaternion
+            radius (withNone[float], optional): the angle to search in, the resolution when None. Defaults to None.
+
+        Returns:
+            list[int]: the keys of the found rotations, nearest first
+        """
+        if radius is None:
+            radius = self.resolution
+
+        q = canonicalize(q)
+        reach = max(1, math.ceil(_chord(radius) / self._cell_size))
+        distances = (
+            (angular_distance(q, self._quaternions[key]), key)
+            for key in self._candidates(q, reach)
+        )
+        return [key for distance, key in sorted(distances) if distance <= radius]
+
+    def find_duplicate(
+        self, q: Quaternion, tolerance: withNone[float] = None
+    ) -> withNone[int]:
+        """returns the key of a stored rotation at most tolerance radians from q, None when there is none"""
+        keys = self.within(q, tolerance)
+        return keys[0] if keys else None
+
+    def nearest(self, q: Quaternion) -> withNone[tuple[int, float]]:
+        """finds the stored rotation nearest to q
+
+        Returns:
+            withNone[tuple[int, float]]: the key and angular distance of the nearest rotation, None when the index is empty
+        """
+        if not self._quaternions:
+            return None
+
+        q = canonicalize(q)
+        reach = 1
+
+        while True:
+            covers_all = reach * self._cell_size >= 2
+            keys = range(len(self)) if covers_all else self._candidates(q, reach)
+            best = min(
+                ((angular_distance(q, self._quaternions[key]), key) for key in keys),
+                default=None,
+            )
+
+            # every rotation within reach cells of q was a candidate
+            if best is not None and (
+                covers_all or _chord(best[0]) <= reach * self._cell_size
+            ):
+                return best[1], best[0]
+
+            reach *= 2
+
+
+def deduplicate(
+    quaternions: Iterable[Quaternion], tolerance: float
+) -> tuple[list[Quaternion], list[int]]:
+    """removes rotations that are at most tolerance radians from an earlier one
+
+    Returns:
+        tuple[list[Quaternion], list[int]]: the canonical unique rotations and, for every input, the position of its unique rotation
+    """
+    index = OrientationIndex(tolerance)
+    assignments: list[int] = []
+
+    for q in quaternions:
+        key = index.find_duplicate(q)
+        assignments.append(index.add(q) if key is None else key)
+
+    return [index[key][0] for key in range(len(index))], assignments
@@ -0,0 +1,134 @@
+import math
+from typing import Sequence
+from .vector import Vector
+
+DEFAULT_TOLERANCE = 1e-12
+
+
+def _check_lengths(vectors: Sequence[Vector]) -> int:
+    lengths = {v.length for v in vectors}
+    if len(lengths) > 1:
+        raise ValueError("all the vectors must have the same length")
+    return lengths.pop() if lengths else 0
+
+
+def gram_schmidt(
+    vectors: Sequence[Vector],
+    reorthogonalize: bool = False,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> tuple[Sequence[Vector], list[list[float]]]:
+    """orthonormalizes vectors in place with the modified Gram-Schmidt process
+
+    Args:
+        vectors (Sequence[Vector]): the vectors to orthonormalize, they are overwritten by the basis
+        reorthogonalize (bool, optional): runs every projection twice, which keeps the basis orthogonal when the vectors are almost dependent. Defaults to False.
+        tolerance (float, optional): a vector whose norm drops below tolerance times its original norm is considered dependent. Defaults to DEFAULT_TOLERANCE.
+
+    Raises:
+        ValueError: when the vectors have different lengths or are linearly dependent
+
+    Returns:
+        tuple[Sequence[Vector], list[list[float]]]: the basis (vectors) and the upper triangular coefficients r, such that the original k'th vector is the sum of r[i][k] * basis[i]
+    """
+    _check_lengths(vectors)
+
+    count = len(vectors)
+    sumprod = math.sumprod
+    basis: list[list[float]] = []
+    r = [[0.0] * count for _ in range(count)]
+
+    for k, vector in enumerate(vectors):
+        values = list(vector.values)
+        original_norm = math.sqrt(sumprod(values, values))
+
+        for _ in range(2 if reorthogonalize else 1):
+            for i, q in enumerate(basis):
+                coefficient = sumprod(q, values)
+                r[i][k] += coefficient
+                values = [v - coefficient * q_v for v, q_v in zip(values, q)]
+
+        norm = math.sqrt(sumprod(values, values))
+        if original_norm == 0 or norm <= tolerance * original_norm:
+            raise ValueError("cannot orthonormalize linearly dependent vectors")
+
+        r[k][k] = norm
+        basis.append([v / norm for v in values])
+
+    # written only once every vector is known to be independent, so a failure leaves them unchanged
+    for vector, values in zip(vectors, basis):
+        vector.values[:] = values
+
+    return vectors, r
+
+
+def householder_qr(
+    vectors: Sequence[Vector], tolerance: float = DEFAULT_TOLERANCE
+) -> tuple[Sequence[Vector], list[list[float]]]:
+    """orthonormalizes vectors in place with Householder reflections (a thin QR decomposition)
+
+    the vectors are the columns of A = QR, the diagonal of r is made non negative, so the
+    result matches gram_schmidt up to rounding
+
+    Args:
+        vectors (Sequence[Vector]): the vectors to orthonormalize, they are overwritten by the columns of Q
+        tolerance (float, optional): a diagonal entry of r below tolerance times the largest vector norm is considered dependent. Defaults to DEFAULT_TOLERANCE.
+
+    Raises:
+        ValueError: when the vectors have different lengths, there are more vectors than their length, or they are linearly dependent
+
+    Returns:
+        tuple[Sequence[Vector], list[list[float]]]: Q (vectors) and the upper triangular r
+    """
+    dimension = _check_lengths(vectors)
+    count = len(vectors)
+
+    if count > dimension:
+        raise ValueError("cannot orthonormalize more vectors than their length")
+
+    sumprod = math.sumprod
+    columns = [list(v.values) for v in vectors]
+    scale = max((math.sqrt(sumprod(c, c)) for c in columns), default=0.0)
+    reflectors: list[list[float]] = []
+
+    for k in range(count):
+        x = columns[k][k:]
+        alpha = -math.copysign(math.sqrt(sumprod(x, x)), x[0])
+
+        if abs(alpha) <= tolerance * scale:
+            raise ValueError("cannot orthonormalize linearly dependent vectors")
+
+        # H = I - 2 v v^T / (v^T v) maps x to (alpha, 0, ..., 0)
+        v = x
+        v[0] -= alpha
+        factor = 2 / sumprod(v, v)
+        reflectors.append(v)
+
+        columns[k][k] = alpha
+        for i in range(k + 1, dimension):
+            columns[k][i] = 0.0
+
+        for column in columns[k + 1 :]:
+            s = factor * sumprod(v, column[k:])
+            for i, v_i in enumerate(v, k):
+                column[i] -= s * v_i
+
+    r = [[columns[j][i] if i <= j else 0.0 for j in range(count)] for i in range(count)]
+
+    for j, vector in enumerate(vectors):
+        # the j'th column of Q is H_0 H_1 ... H_(n - 1) e_j
+        q = [0.0] * dimension
+        q[j] = 1.0
+
+        for k in range(count - 1, -1, -1):
+            v = reflectors[k]
+            s = 2 / sumprod(v, v) * sumprod(v, q[k:])
+            for i, v_i in enumerate(v, k):
+                q[i] -= s * v_i
+
+        if r[j][j] < 0:
+            q = [-q_i for q_i in q]
+            r[j] = [-r_j for r_j in r[j]]
+
+        vector.values[:] = q
+
+    return vectors, r
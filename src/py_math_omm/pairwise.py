@@ -0,0 +1,151 @@
+import math
+import mmap
+from array import array
+from os import PathLike
+from typing import Iterator, Sequence
+from .vector import Vector
+
+# (first row, first column, rows of the block)
+type PairwiseBlock = tuple[int, int, list[array]]
+
+METRICS = ("dot", "sqeuclidean", "euclidean", "cosine")
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+_ITEM_SIZE = array("d").itemsize
+
+
+def block_shape(rows: int, columns: int, memory_budget: int) -> tuple[int, int]:
+    """computes the largest block of results that fits in memory_budget bytes
+
+    Args:
+        rows (int): number of rows of the full result
+        columns (int): number of columns of the full result
+        memory_budget (int): bytes available for a single block
+
+    Returns:
+        tuple[int, int]: the rows and columns of a block, at least 1 each
+    """
+    entries = max(1, memory_budget // _ITEM_SIZE)
+    block_columns = max(1, min(columns, entries))
+    block_rows = max(1, min(rows, entries // block_columns))
+    return block_rows, block_columns
+
+
+def _values(vectors: Sequence[Vector]) -> list[tuple[float, ...]]:
+    return [tuple(v.values) for v in vectors]
+
+
+def pairwise_blocks(
+    a: Sequence[Vector],
+    b: Sequence[Vector],
+    metric: str = "euclidean",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> Iterator[PairwiseBlock]:
+    """computes metric between every vector of a and every vector of b, a block at a time
+
+    the squared norms are computed once, distances use |x - y|^2 = |x|^2 + |y|^2 - 2 x.y
+
+    Args:
+        a (Sequence[Vector]): the vectors of the rows
+        b (Sequence[Vector]): the vectors of the columns
+        metric (str, optional): one of "dot", "sqeuclidean", "euclidean" and "cosine". Defaults to "euclidean".
+        memory_budget (int, optional): bytes a single block may take. Defaults to DEFAULT_MEMORY_BUDGET.
+
+    Raises:
+        ValueError: when metric is unknown, the vectors have different lengths or a vector is zero with the cosine metric
+
+    Yields:
+        Iterator[PairwiseBlock]: the blocks in row major order
+    """
+    if metric not in METRICS:
+        raise ValueError(f"unknown metric {metric!r}, expected one of {METRICS}")
+
+    a_values = _values(a)
+    b_values = _values(b)
+
+    lengths = {len(v) for v in a_values} | {len(v) for v in b_values}
+    if len(lengths) > 1:
+        raise ValueError("all the vectors must have the same length")
+
+    sumprod = math.sumprod
+    a_norms = [sumprod(v, v) for v in a_values]
+    b_norms = [sumprod(v, v) for v in b_values]
+
+    if metric == "cosine":
+        if 0 in a_norms or 0 in b_norms:
+            raise ValueError("cosine similarity is not defined for zero vectors")
+        a_scales = [1 / math.sqrt(n) for n in a_norms]
+        b_scales = [1 / math.sqrt(n) for n in b_norms]
+
+    block_rows, block_columns = block_shape(len(a_values), len(b_values), memory_budget)
+
+    for row_start in range(0, len(a_values), block_rows):
+        row_stop = min(row_start + block_rows, len(a_values))
+
+        for column_start in range(0, len(b_values), block_columns):
+            column_stop = min(column_start + block_columns, len(b_values))
+            columns = range(column_start, column_stop)
+            rows: list[array] = []
+
+            for i in range(row_start, row_stop):
+                x = a_values[i]
+                dots = [sumprod(x, b_values[j]) for j in columns]
+
+                if metric == "dot":
+                    row = dots
+                elif metric == "cosine":
+                    scale = a_scales[i]
+                    row = [d * scale * b_scales[j] for d, j in zip(dots, columns)]
+                else:
+                    x_norm = a_norms[i]
+                    # rounding can make the distance of (almost) equal vectors slightly negative
+                    row = [
+                        max(0.0, x_norm + b_norms[j] - 2 * d)
+                        for d, j in zip(dots, columns)
+                    ]
+                    if metric == "euclidean":
+                        row = [math.sqrt(d) for d in row]
+
+                rows.append(array("d", row))
+
+            yield row_start, column_start, rows
+
+
+def pairwise_to_file(
+    a: Sequence[Vector],
+    b: Sequence[Vector],
+    path: str | PathLike,
+    metric: str = "euclidean",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> tuple[int, int]:
+    """writes the full pairwise matrix to path through a memory map
+
+    the file holds len(a) * len(b) native doubles in row major order, it can be read back
+    with array("d").frombytes or numpy.memmap
+
+    Raises:
+        ValueError: same as pairwise_blocks
+
+    Returns:
+        tuple[int, int]: the shape of the matrix
+    """
+    rows, columns = len(a), len(b)
+    size = rows * columns * _ITEM_SIZE
+
+    with open(path, "w+b") as file:
+        if size == 0:
+            return rows, columns
+
+        file.truncate(size)
+
+        with mmap.mmap(file.fileno(), size) as output:
+            for row_start, column_start, block in pairwise_blocks(
+                a, b, metric, memory_budget
+            ):
+                for offset, row in enumerate(block, row_start):
+                    start = (offset * columns + column_start) * _ITEM_SIZE
+                    output[start : start + len(row) * _ITEM_SIZE] = row.tobytes()
+
+            output.flush()
+
+    return rows, columns
@@ -1,8 +1,13 @@
+import cmath
 import math
 from typing import Callable, overload
-from .types import real_number, complex_number
+from .types import withNone, real_number, complex_number
 
 type quaternion_number = complex_number | Quaternion
+type _Handler = Callable[[Quaternion, object], object]
+
+# abs2 of a quaternion within this distance of 1 takes the unit quaternion fast paths
+UNIT_TOLERANCE = 1e-12
 
 
 class Quaternion(object):
@@ -40,10 +45,20 @@ class Quaternion(object):
         elif isinstance(r, complex):
             self.r = r.real
             self.i = r.imag
-            self.j = 0
-            self.k = 0
+            self.j = 0.0
+            self.k = 0.0
         else:
-            self.r, self.i, self.j, self.k = r
+            self.r, self.i, self.j, self.k = (float(v) for v in r)
+
+    @staticmethod
+    def _from_floats(r: float, i: float, j: float, k: float) -> "Quaternion":
+        # skips the type checks of __init__, the values must already be floats
+        quaternion = Quaternion.__new__(Quaternion)
+        quaternion.r = r
+        quaternion.i = i
+        quaternion.j = j
+        quaternion.k = k
+        return quaternion
 
     @property
     def real(self) -> float:
@@ -81,6 +96,80 @@ class Quaternion(object):
     def abs2(self) -> float:
         return self.r * self.r + self.i * self.i + self.j * self.j + self.k * self.k
 
+    def exp(self) -> "Quaternion":
+        r, i, j, k = self.r, self.i, self.j, self.k
+
+        if j == 0 and k == 0:
+            if i == 0:
+                return Quaternion._from_floats(math.exp(r), 0.0, 0.0, 0.0)
+            z = cmath.exp(complex(r, i))
+            return Quaternion._from_floats(z.real, z.imag, 0.0, 0.0)
+
+        # hypot does not underflow, so it is not 0 when j or k is not 0
+        vector_abs = math.hypot(i, j, k)
+        scale = math.exp(r)
+        factor = scale * math.sin(vector_abs) / vector_abs
+        return Quaternion._from_floats(
+            scale * math.cos(vector_abs), i * factor, j * factor, k * factor
+        )
+
+    def log(self) -> "Quaternion":
+        """computes the principal natural logarithm of self
+
+        Raises:
+            ValueError: when self is zero
+
+        Returns:
+            Quaternion: the logarithm
+        """
+        r, i, j, k = self.r, self.i, self.j, self.k
+
+        if j == 0 and k == 0:
+            if i == 0 and r > 0:
+                return Quaternion._from_floats(math.log(r), 0.0, 0.0, 0.0)
+            if i == 0 and r == 0:
+                raise ValueError("cannot take the logarithm of zero")
+            z = cmath.log(complex(r, i))
+            return Quaternion._from_floats(z.real, z.imag, 0.0, 0.0)
+
+        # hypot does not underflow, so it is not 0 when j or k is not 0
+        vector_abs = math.hypot(i, j, k)
+        abs2 = r * r + vector_abs * vector_abs
+        log_abs = 0.0 if abs(abs2 - 1) <= UNIT_TOLERANCE else 0.5 * math.log(abs2)
+        factor = math.atan2(vector_abs, r) / vector_abs
+        return Quaternion._from_floats(log_abs, i * factor, j * factor, k * factor)
+
+    def sqrt(self) -> "Quaternion":
+        """computes the principal square root of self
+
+        Returns:
+            Quaternion: the square root
+        """
+        r, i, j, k = self.r, self.i, self.j, self.k
+
+        if j == 0 and k == 0:
+            if i == 0 and r >= 0:
+                return Quaternion._from_floats(math.sqrt(r), 0.0, 0.0, 0.0)
+            z = cmath.sqrt(complex(r, i))
+            return Quaternion._from_floats(z.real, z.imag, 0.0, 0.0)
+
+        # hypot does not underflow for tiny vector parts
+        vector_abs = math.hypot(i, j, k)
+        norm = math.hypot(r, vector_abs)
+
+        # the real part is sqrt((norm + r) / 2) and the vector part is v / (2 * real), for
+        # negative r norm + r cancels, so the length s = sqrt((norm - r) / 2) of the vector
+        # part is computed instead and real = |v| / (2 * s)
+        if r >= 0:
+            real = math.sqrt((norm + r) / 2)
+            factor = 1 / (2 * real)
+        else:
+            s = math.sqrt((norm - r) / 2)
+            real = vector_abs / (2 * s)
+            factor = s / vector_abs
+
+        return Quaternion._from_floats(real, i * factor, j * factor, k * factor)
+
     def __create_with_transformation(
         self, transform: Callable[[float], float]
     ) -> "Quaternion":
@@ -89,53 +178,37 @@ class Quaternion(object):
         )
 
     def __add__(self, other: quaternion_number) -> "Quaternion":
-        if isinstance(other, (int, float)):
-            return Quaternion(self.r + other, self.i, self.j, self.k)
-        if isinstance(other, complex):
-            return Quaternion(self.r + other.real, self.i + other.imag, self.j, self.k)
-        if isinstance(other, Quaternion):
-            return Quaternion(
-                self.r + other.r, self.i + other.i, self.j + other.j, self.k + other.k
-            )
+        handler = _add_handlers.get(type(other)) or _resolve_handler(
+            _add_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __sub__(self, other: quaternion_number) -> "Quaternion":
-        if isinstance(other, (int, float)):
-            return Quaternion(self.r - other, self.i, self.j, self.k)
-        if isinstance(other, complex):
-            return Quaternion(self.r - other.real, self.i - other.imag, self.j, self.k)
-        if isinstance(other, Quaternion):
-            return Quaternion(
-                self.r - other.r, self.i - other.i, self.j - other.j, self.k - other.k
-            )
+        handler = _sub_handlers.get(type(other)) or _resolve_handler(
+            _sub_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __mul__(self, other: quaternion_number) -> "Quaternion":
-        # 1*1 = 1, 1*i = i, 1*j = j, 1*k = k
-        # i*1 = i, i*i = -1, i*j = k, i*k = -j
-        # j*1 = j, j*i = -k, j*j = -1, j*k = i
-        # k*1 = k, k*i = j, k*j = -i, k*k = -1
-        if isinstance(other, (int, float)):
-            return self.__create_with_transformation(lambda f: f * other)
-        if isinstance(other, complex):
-            r, i = other.real, other.imag
-            r_val = self.r * r - self.i * i
-            i_val = self.r * i + self.i * r
-            j_val = self.j * r + self.k * i
-            k_val = -self.j * i + self.k * r
-            return Quaternion(r_val, i_val, j_val, k_val)
-        if isinstance(other, Quaternion):
-            r, i, j, k = other.r, other.i, other.j, other.k
-            r_val = self.r * r - self.i * i - self.j * j - self.k * k
-            i_val = self.r * i + self.i * r + self.j * k - self.k * j
-            j_val = self.r * j - self.i * k + self.j * r + self.k * i
-            k_val = self.r * k + self.i * j - self.j * i + self.k * r
-            return Quaternion(r_val, i_val, j_val, k_val)
+        handler = _mul_handlers.get(type(other)) or _resolve_handler(
+            _mul_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __truediv__(self, other: quaternion_number) -> "Quaternion":
         # self / other
-        if isinstance(other, (int, float, complex)):
-            return self * (1 / other)
-        if isinstance(other, Quaternion):
-            return self * other.inverse()
+        handler = _truediv_handlers.get(type(other)) or _resolve_handler(
+            _truediv_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __floordiv__(self, other: quaternion_number) -> "Quaternion":
         return (self / other).__floor__()
@@ -146,6 +219,19 @@ class Quaternion(object):
     def __divmod__(self, other: real_number) -> tuple["Quaternion", "Quaternion"]:
         return (self // other, self % other)
 
+    def __pow__(self, other: quaternion_number) -> "Quaternion":
+        """raises self to the power of other
+
+        integer powers are computed exactly by binary exponentiation, real powers by the
+        polar form of self and complex or quaternion powers as exp(log(self) * other)
+        """
+        handler = _pow_handlers.get(type(other)) or _resolve_handler(
+            _pow_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
+
     def __radd__(self, other: quaternion_number) -> "Quaternion":
         return self + other
 
@@ -156,10 +242,12 @@ class Quaternion(object):
         return other * self.inverse()
 
     def __rmul__(self, other: quaternion_number) -> "Quaternion":
-        if isinstance(other, (int, float, complex)):
-            return Quaternion(other) * self
-        if isinstance(other, Quaternion):
-            return other * self
+        handler = _rmul_handlers.get(type(other)) or _resolve_handler(
+            _rmul_handlers, other
+        )
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __abs__(self) -> float:
         return math.sqrt(self.abs2())
@@ -189,23 +277,10 @@ class Quaternion(object):
         return not self.is_zero
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, (int | float)):
-            other = float(other)
-            if self.is_real:
-                return self.r == other
-            return False
-        if isinstance(other, complex):
-            if self.is_py_complex:
-                return (self.r == other.real) and (self.i == other.imag)
-            return False
-        if isinstance(other, Quaternion):
-            return (
-                (self.r == other.r)
-                and (self.i == other.i)
-                and (self.j == other.j)
-                and (self.k == other.k)
-            )
-        return other.__eq__(self)
+        handler = _eq_handlers.get(type(other)) or _resolve_handler(_eq_handlers, other)
+        if handler is None:
+            return NotImplemented
+        return handler(self, other)
 
     def __ne__(self, other) -> bool:
         return not self == other
@@ -215,3 +290,201 @@ class Quaternion(object):
 
     def __repr__(self) -> str:
         return f"Quaternion({self.r}, {self.i}, {self.j}, {self.k})"
+
+
+# the operators dispatch on type(other) through these tables instead of chains
+# of isinstance checks, subclasses of the keys are resolved by their mro and are
+# not added to the tables, so the tables never grow past the types listed here
+
+
+def _resolve_handler(
+    handlers: dict[type, _Handler], other: object
+) -> withNone[_Handler]:
+    for base in type(other).__mro__:
+        handler = handlers.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _add_real(q: Quaternion, other: real_number) -> Quaternion:
+    return Quaternion._from_floats(q.r + other, q.i, q.j, q.k)
+
+
+def _add_complex(q: Quaternion, other: complex) -> Quaternion:
+    return Quaternion._from_floats(q.r + other.real, q.i + other.imag, q.j, q.k)
+
+
+def _add_quaternion(q: Quaternion, other: Quaternion) -> Quaternion:
+    return Quaternion._from_floats(
+        q.r + other.r, q.i + other.i, q.j + other.j, q.k + other.k
+    )
+
+
+def _sub_real(q: Quaternion, other: real_number) -> Quaternion:
+    return Quaternion._from_floats(q.r - other, q.i, q.j, q.k)
+
+
+def _sub_complex(q: Quaternion, other: complex) -> Quaternion:
+    return Quaternion._from_floats(q.r - other.real, q.i - other.imag, q.j, q.k)
+
+
+def _sub_quaternion(q: Quaternion, other: Quaternion) -> Quaternion:
+    return Quaternion._from_floats(
+        q.r - other.r, q.i - other.i, q.j - other.j, q.k - other.k
+    )
+
+
+def _mul_real(q: Quaternion, other: real_number) -> Quaternion:
+    # a real scalar commutes with every quaternion, so this also serves __rmul__
+    return Quaternion._from_floats(q.r * other, q.i * other, q.j * other, q.k * other)
+
+
+def _mul_complex(q: Quaternion, other: complex) -> Quaternion:
+    # q * (r + i*i)
+    r, i = other.real, other.imag
+    return Quaternion._from_floats(
+        q.r * r - q.i * i,
+        q.r * i + q.i * r,
+        q.j * r + q.k * i,
+        -q.j * i + q.k * r,
+    )
+
+
+def _rmul_complex(q: Quaternion, other: complex) -> Quaternion:
+    # (r + i*i) * q
+    r, i = other.real, other.imag
+    return Quaternion._from_floats(
+        r * q.r - i * q.i,
+        r * q.i + i * q.r,
+        r * q.j - i * q.k,
+        r * q.k + i * q.j,
+    )
+
+
+def _hamilton_product(a: Quaternion, b: Quaternion) -> Quaternion:
+    # 1*1 = 1, 1*i = i, 1*j = j, 1*k = k
+    # i*1 = i, i*i = -1, i*j = k, i*k = -j
+    # j*1 = j, j*i = -k, j*j = -1, j*k = i
+    # k*1 = k, k*i = j, k*j = -i, k*k = -1
+    r, i, j, k = b.r, b.i, b.j, b.k
+    return Quaternion._from_floats(
+        a.r * r - a.i * i - a.j * j - a.k * k,
+        a.r * i + a.i * r + a.j * k - a.k * j,
+        a.r * j - a.i * k + a.j * r + a.k * i,
+        a.r * k + a.i * j - a.j * i + a.k * r,
+    )
+
+
+def _rmul_quaternion(q: Quaternion, other: Quaternion) -> Quaternion:
+    return _hamilton_product(other, q)
+
+
+def _truediv_real(q: Quaternion, other: real_number) -> Quaternion:
+    return _mul_real(q, 1 / other)
+
+
+def _truediv_complex(q: Quaternion, other: complex) -> Quaternion:
+    return _mul_complex(q, 1 / other)
+
+
+def _truediv_quaternion(q: Quaternion, other: Quaternion) -> Quaternion:
+    return _hamilton_product(q, other.inverse())
+
+
+def _eq_real(q: Quaternion, other: real_number) -> bool:
+    return q.r == other and q.i == 0 and q.j == 0 and q.k == 0
+
+
+def _eq_complex(q: Quaternion, other: complex) -> bool:
+    return q.r == other.real and q.i == other.imag and q.j == 0 and q.k == 0
+
+
+def _eq_quaternion(q: Quaternion, other: Quaternion) -> bool:
+    return q.r == other.r and q.i == other.i and q.j == other.j and q.k == other.k
+
+
+def _pow_int(q: Quaternion, other: int) -> Quaternion:
+    if other < 0:
+        q = q.inverse()
+        other = -other
+
+    result = Quaternion._from_floats(1.0, 0.0, 0.0, 0.0)
+
+    while other:
+        if other & 1:
+            result = _hamilton_product(result, q)
+        other >>= 1
+        if other:
+            q = _hamilton_product(q, q)
+
+    return result
+
+
+def _pow_real(q: Quaternion, other: real_number) -> Quaternion:
+    r, i, j, k = q.r, q.i, q.j, q.k
+
+    if j == 0 and k == 0:
+        if i == 0 and r > 0:
+            return Quaternion._from_floats(r**other, 0.0, 0.0, 0.0)
+        z = complex(r, i) ** other
+        return Quaternion._from_floats(z.real, z.imag, 0.0, 0.0)
+
+    # q = |q| * (cos(theta) + u * sin(theta)) => q^t = |q|^t * (cos(t * theta) + u * sin(t * theta))
+    # hypot does not underflow, so it is not 0 when j or k is not 0
+    vector_abs = math.hypot(i, j, k)
+    abs2 = r * r + vector_abs * vector_abs
+    scale = 1.0 if abs(abs2 - 1) <= UNIT_TOLERANCE else abs2 ** (other / 2)
+    angle = other * math.atan2(vector_abs, r)
+    factor = scale * math.sin(angle) / vector_abs
+    return Quaternion._from_floats(
+        scale * math.cos(angle), i * factor, j * factor, k * factor
+    )
+
+
+def _pow_quaternion(q: Quaternion, other: complex | Quaternion) -> Quaternion:
+    return (q.log() * other).exp()
+
+
+_add_handlers: dict[type, _Handler] = {
+    int: _add_real,
+    float: _add_real,
+    complex: _add_complex,
+    Quaternion: _add_quaternion,
+}
+_sub_handlers: dict[type, _Handler] = {
+    int: _sub_real,
+    float: _sub_real,
+    complex: _sub_complex,
+    Quaternion: _sub_quaternion,
+}
+_mul_handlers: dict[type, _Handler] = {
+    int: _mul_real,
+    float: _mul_real,
+    complex: _mul_complex,
+    Quaternion: _hamilton_product,
+}
+_rmul_handlers: dict[type, _Handler] = {
+    int: _mul_real,
+    float: _mul_real,
+    complex: _rmul_complex,
+    Quaternion: _rmul_quaternion,
+}
+_truediv_handlers: dict[type, _Handler] = {
+    int: _truediv_real,
+    float: _truediv_real,
+    complex: _truediv_complex,
+    Quaternion: _truediv_quaternion,
+}
+_eq_handlers: dict[type, _Handler] = {
+    int: _eq_real,
+    float: _eq_real,
+    complex: _eq_complex,
+    Quaternion: _eq_quaternion,
+}
+_pow_handlers: dict[type, _Handler] = {
+    int: _pow_int,
+    float: _pow_real,
+    complex: _pow_quaternion,
+    Quaternion: _pow_quaternion,
+}
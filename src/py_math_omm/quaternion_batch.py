@@ -0,0 +1,47 @@
+from typing import Iterable
+from .quaternion import Quaternion, quaternion_number
+
+
+def batch_exp(quaternions: Iterable[Quaternion]) -> list[Quaternion]:
+    exp = Quaternion.exp
+    return [exp(q) for q in quaternions]
+
+
+def batch_log(quaternions: Iterable[Quaternion]) -> list[Quaternion]:
+    log = Quaternion.log
+    return [log(q) for q in quaternions]
+
+
+def batch_sqrt(quaternions: Iterable[Quaternion]) -> list[Quaternion]:
+    sqrt = Quaternion.sqrt
+    return [sqrt(q) for q in quaternions]
+
+
+def batch_pow(
+    quaternions: Iterable[Quaternion],
+    exponents: quaternion_number | Iterable[quaternion_number],
+) -> list[Quaternion]:
+    """raises every quaternion to a power
+
+    Args:
+        quaternions (Iterable[Quaternion]): the bases
+        exponents (quaternion_number | Iterable[quaternion_number]): a single exponent for all the bases, or one exponent per base
+
+    Raises:
+        ValueError: when there is a different number of exponents than bases
+
+    Returns:
+        list[Quaternion]: the powers
+    """
+    power = Quaternion.__pow__
+
+    if isinstance(exponents, (int, float, complex, Quaternion)):
+        return [power(q, exponents) for q in quaternions]
+
+    quaternions = list(quaternions)
+    exponents = list(exponents)
+
+    if len(quaternions) != len(exponents):
+        raise ValueError("expected one exponent per quaternion")
+
+    return [power(q, e) for q, e in zip(quaternions, exponents)]
@@ -0,0 +1,244 @@
+import math
+from fractions import Fraction
+from typing import Iterable, Iterator, SupportsIndex, overload
+from .types import withNone
+from .generic_vector import GenericVector
+
+type rational_number = int | Fraction
+
+
+class RationalVector(GenericVector[Fraction]):
+    """an exact GenericVector of fractions, stored as integer numerators over one shared denominator
+
+    arithmetic works on the integers and does not reduce the results, except that a scalar
+    factor is cancelled against the denominator, the fractions are only reduced when they are
+    observed (through values, indexing or iteration) or by reduce()
+    """
+
+    def __init__(self, *values: rational_number) -> None:
+        fractions = [Fraction(v) for v in values]
+        denominator = math.lcm(*(f.denominator for f in fractions)) if fractions else 1
+
+        self.numerators = [
+            f.numerator * (denominator // f.denominator) for f in fractions
+        ]
+        self.denominator = denominator
+        self.zero_value = Fraction(0)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[rational_number]) -> "RationalVector":
+        return cls(*values)
+
+    @classmethod
+    def from_numerators(
+        cls, numerators: Iterable[int], denominator: int = 1
+    ) -> "RationalVector":
+        """creates the vector numerators / denominator without reducing it
+
+        Raises:
+            ValueError: when denominator is not positive
+        """
+        if denominator <= 0:
+            raise ValueError("the denominator must be positive")
+
+        vector = cls.__new__(cls)
+        vector.numerators = list(numerators)
+        vector.denominator = denominator
+        vector.zero_value = Fraction(0)
+        return vector
+
+    @property
+    def values(self) -> list[Fraction]:
+        denominator = self.denominator
+        return [Fraction(n, denominator) for n in self.numerators]
+
+    @property
+    def length(self) -> int:
+        return len(self.numerators)
+
+    @property
+    def is_zero_vector(self) -> bool:
+        return not any(self.numerators)
+
+    def reduce(self) -> "RationalVector":
+        """divides the numerators and the denominator by their greatest common divisor, in place"""
+        divisor = math.gcd(self.denominator, *self.numerators)
+
+        if divisor > 1:
+            self.numerators = [n // divisor for n in self.numerators]
+            self.denominator //= divisor
+
+        return self
+
+    def _as_generic(self) -> GenericVector[Fraction]:
+        # values builds every fraction on each access, so the inherited loops, which index it
+        # once per element, run on a plain GenericVector of the values instead
+        return GenericVector(self.zero_value, *self.values)
+
+    def _common(self, other: "RationalVector") -> tuple[list[int], list[int], int]:
+        # the numerators of self and other over their least common denominator
+        if self.denominator == other.denominator:
+            return self.numerators, other.numerators, self.denominator
+
+        denominator = math.lcm(self.denominator, other.denominator)
+        self_factor = denominator // self.denominator
+        other_factor = denominator // other.denominator
+        return (
+            [n * self_factor for n in self.numerators],
+            [n * other_factor for n in other.numerators],
+            denominator,
+        )
+
+    def dot(self, other: GenericVector[Fraction]) -> withNone[Fraction]:
+        if not isinstance(other, RationalVector):
+            return self._as_generic().dot(other)
+
+        if self.length != other.length or self.length == 0:
+            return None
+
+        # a single reduction instead of one per product and sum
+        return Fraction(
+            math.sumprod(self.numerators, other.numerators),
+            self.denominator * other.denominator,
+        )
+
+    def is_orthogonal(self, other: GenericVector[Fraction], /) -> bool:
+        if not isinstance(other, RationalVector):
+            return self._as_generic().is_orthogonal(other)
+
+        return (
+            self.length == other.length
+            and math.sumprod(self.numerators, other.numerators) == 0
+        )
+
+    def is_parralel(self, other: GenericVector[Fraction]) -> bool:
+        if not isinstance(other, RationalVector):
+            return self._as_generic().is_parralel(other)
+
+        if self.is_zero_vector or other.is_zero_vector:
+            return False
+
+        if self.length != other.length:
+            return False
+
+        # the shared denominators cancel, so self || other exactly when the numerators are
+        # proportional: a[i] * b[pivot] == b[i] * a[pivot] for every i
+        a = self.numerators
+        b = other.numerators
+        pivot = next(i for i, n in enumerate(a) if n != 0)
+        a_pivot, b_pivot = a[pivot], b[pivot]
+
+        if b_pivot == 0:
+            return False
+
+        return all(a_i * b_pivot == b_i * a_pivot for a_i, b_i in zip(a, b))
+
+    def __add__(self, other: "RationalVector", /) -> "RationalVector":
+        if not isinstance(other, RationalVector):
+            return NotImplemented
+
+        a, b, denominator = self._common(other)
+        if len(a) < len(b):
+            a, b = b, a
+
+        numerators = [n + m for n, m in zip(a, b)] + a[len(b) :]
+        return RationalVector.from_numerators(numerators, denominator)
+
+    def __sub__(self, other: "RationalVector", /) -> "RationalVector":
+        if not isinstance(other, RationalVector):
+            return NotImplemented
+
+        return self + (-other)
+
+    def __mul__(self, other: rational_number, /) -> "RationalVector":
+        if not isinstance(other, (int, Fraction)):
+            return NotImplemented
+
+        other = Fraction(other)
+        # cancelling the scalar's numerator against the denominator keeps repeated scaling
+        # from growing the denominator, at the cost of one gcd of two integers
+        divisor = math.gcd(other.numerator, self.denominator)
+        numerator = other.numerator // divisor
+        return RationalVector.from_numerators(
+            [n * numerator for n in self.numerators],
+            self.denominator // divisor * other.denominator,
+        )
+
+    def __rmul__(self, other: rational_number, /) -> "RationalVector":
+        return self.__mul__(other)
+
+    def __truediv__(self, other: rational_number, /) -> "RationalVector":
+        if not isinstance(other, (int, Fraction)):
+            return NotImplemented
+
+        return self * (1 / Fraction(other))
+
+    def __neg__(self) -> "RationalVector":
+        return RationalVector.from_numerators(
+            [-n for n in self.numerators], self.denominator
+        )
+
+    def __pos__(self) -> "RationalVector":
+        return RationalVector.from_numerators(self.numerators, self.denominator)
+
+    @overload
+    def __getitem__(self, i: SupportsIndex, /) -> Fraction: ...
+
+    @overload
+    def __getitem__(self, s: slice, /) -> list[Fraction]: ...
+
+    def __getitem__(self, i: SupportsIndex | slice, /) -> Fraction | list[Fraction]:
+        if isinstance(i, slice):
+            denominator = self.denominator
+            return [Fraction(n, denominator) for n in self.numerators[i]]
+
+        return Fraction(self.numerators[i], self.denominator)
+
+    @overload
+    def __setitem__(self, i: SupportsIndex, value: rational_number, /) -> None: ...
+
+    @overload
+    def __setitem__(self, s: slice, values: Iterable[rational_number], /) -> None: ...
+
+    def __setitem__(
+        self,
+        key: SupportsIndex | slice,
+        value: rational_number | Iterable[rational_number],
+        /,
+    ) -> None:
+        fractions = (
+            [Fraction(v) for v in value]
+            if isinstance(key, slice)
+            else [Fraction(value)]
+        )
+        denominator = math.lcm(self.denominator, *(f.denominator for f in fractions))
+
+        if denominator != self.denominator:
+            factor = denominator // self.denominator
+            self.numerators = [n * factor for n in self.numerators]
+            self.denominator = denominator
+
+        numerators = [f.numerator * (denominator // f.denominator) for f in fractions]
+
+        if isinstance(key, slice):
+            self.numerators[key] = numerators
+        else:
+            self.numerators[key] = numerators[0]
+
+    def __iter__(self) -> Iterator[Fraction]:
+        return iter(self.values)
+
+    def __eq__(self, other: object, /) -> bool:
+        if not isinstance(other, RationalVector):
+            return self._as_generic().__eq__(other)
+
+        if self.length != other.length:
+            return False
+
+        d_a, d_b = self.denominator, other.denominator
+        return all(
+            n * d_b == m * d_a for n, m in zip(self.numerators, other.numerators)
+        )
+
+    def __repr__(self) -> str:
+        return f"RationalVector({", ".join(v.__repr__() for v in self.values)})"
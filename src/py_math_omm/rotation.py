@@ -0,0 +1,448 @@
+import math
+from typing import Iterable, Sequence
+from .types import withNone, real_number
+from .quaternion import Quaternion
+from .vector import Vector
+
+type Angles3 = tuple[float, float, float]
+type _Quaternion4 = tuple[float, float, float, float]
+
+type Matrix3 = tuple[
+    tuple[float, float, float],
+    tuple[float, float, float],
+    tuple[float, float, float],
+]
+
+
+def rotation_matrix(q: Quaternion) -> Matrix3:
+    """computes the 3x3 rotation matrix of a unit quaternion
+
+    Args:
+        q (Quaternion): the rotation, expected to be a unit quaternion
+
+    Returns:
+        Matrix3: the rows of the matrix
+    """
+    w, x, y, z = q.r, q.i, q.j, q.k
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    return (
+        (1 - 2 * (yy + zz), 2 * (xy - wz), 2 * (xz + wy)),
+        (2 * (xy + wz), 1 - 2 * (xx + zz), 2 * (yz - wx)),
+        (2 * (xz - wy), 2 * (yz + wx), 1 - 2 * (xx + yy)),
+    )
+
+
+def _check_3d(v: Vector) -> None:
+    if v.length != 3:
+        raise ValueError("can only rotate 3 dimensional vectors")
+
+
+def rotate_vector(q: Quaternion, v: Vector) -> Vector:
+    """rotates v by the unit quaternion q, same as the imaginary part of q * v * q.conjugate()
+
+    Raises:
+        ValueError: when v is not 3 dimensional
+    """
+    return rotate_vectors(q, (v,))[0]
+
+
+def rotate_vectors(q: Quaternion, vectors: Iterable[Vector]) -> list[Vector]:
+    """rotates every vector by the unit quaternion q, the rotation matrix is computed once for all of them
+
+    Raises:
+        ValueError: when one of the vectors is not 3 dimensional
+    """
+    return transform_points(q, None, vectors)
+
+
+def transform_points(
+    q: Quaternion, translation: withNone[Vector], points: Iterable[Vector]
+) -> list[Vector]:
+    """rotates every point by the unit quaternion q and then translates it, the rotation matrix is computed once for all of them
+
+    Args:
+        q (Quaternion): the rotation, expected to be a unit quaternion
+        translation (withNone[Vector]): the 3 dimensional translation, None to only rotate
+        points (Iterable[Vector]): the 3 dimensional points
+
+    Raises:
+        ValueError: when one of the points is not 3 dimensional
+
+    Returns:
+        list[Vector]: the transformed points
+    """
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = rotation_matrix(q)
+    tx, ty, tz = (0.0, 0.0, 0.0) if translation is None else translation.values
+    transformed: list[Vector] = []
+
+    for point in points:
+        _check_3d(point)
+        x, y, z = point.values
+        transformed.append(
+            Vector._from_floats(
+                [
+                    m00 * x + m01 * y + m02 * z + tx,
+                    m10 * x + m11 * y + m12 * z + ty,
+                    m20 * x + m21 * y + m22 * z + tz,
+                ]
+            )
+        )
+
+    return transformed
+
+
+def canonicalize(q: Quaternion) -> Quaternion:
+    """picks the one of q and -q (the same rotation) whose first non zero component, in r, i, j, k order, is positive"""
+    for value in (q.r, q.i, q.j, q.k):
+        if value > 0:
+            return q
+        if value < 0:
+            return Quaternion._from_floats(-q.r, -q.i, -q.j, -q.k)
+    return q
+
+
+def angular_distance(a: Quaternion, b: Quaternion) -> float:
+    """computes the angle, in radians, of the rotation between the unit quaternions a and b"""
+    sign = 1.0 if a.r * b.r + a.i * b.i + a.j * b.j + a.k * b.k >= 0 else -1.0
+    # |a - b| = 2 * sin(angle / 4), unlike acos(a.b) it stays accurate for close rotations
+    chord = math.hypot(
+        a.r - sign * b.r, a.i - sign * b.i, a.j - sign * b.j, a.k - sign * b.k
+    )
+    return 4 * math.asin(min(chord / 2, 1.0))
+
+
+def is_same_rotation(a: Quaternion, b: Quaternion, tolerance: float = 1e-9) -> bool:
+    """checks if the unit quaternions a and b are rotations less than tolerance radians apart, q and -q are the same rotation"""
+    return angular_distance(a, b) <= tolerance
+
+
+def slerp(a: Quaternion, b: Quaternion, t: real_number) -> Quaternion:
+    """spherical linear interpolation between the unit quaternions a (t = 0) and b (t = 1), along the shorter arc"""
+    dot = a.r * b.r + a.i * b.i + a.j * b.j + a.k * b.k
+
+    # q and -q are the same rotation
+    sign = 1.0 if dot >= 0 else -1.0
+    br, bi, bj, bk = sign * b.r, sign * b.i, sign * b.j, sign * b.k
+
+    # |a - b| = 2 * sin(angle / 2) and |a + b| = 2 * cos(angle / 2), unlike acos(dot) the
+    # angle stays accurate for close rotations
+    angle = 2 * math.atan2(
+        math.hypot(a.r - br, a.i - bi, a.j - bj, a.k - bk),
+        math.hypot(a.r + br, a.i + bi, a.j + bj, a.k + bk),
+    )
+    sin_angle = math.sin(angle)
+
+    if sin_angle < 1e-12:
+        # a and b are the same rotation up to rounding, a normalized lerp avoids dividing by 0
+        scale_a, scale_b = 1 - t, t
+    else:
+        scale_a = math.sin((1 - t) * angle) / sin_angle
+        scale_b = math.sin(t * angle) / sin_angle
+
+    r = scale_a * a.r + scale_b * br
+    i = scale_a * a.i + scale_b * bi
+    j = scale_a * a.j + scale_b * bj
+    k = scale_a * a.k + scale_b * bk
+    norm = math.sqrt(r * r + i * i + j * j + k * k)
+    return Quaternion._from_floats(r / norm, i / norm, j / norm, k / norm)
+
+
+EULER_ORDERS = (
+    "xyz",
+    "xzy",
+    "yxz",
+    "yzx",
+    "zxy",
+    "zyx",
+    "xyx",
+    "xzx",
+    "yxy",
+    "yzy",
+    "zxz",
+    "zyz",
+)
+
+# a middle euler angle within this distance of 0 or pi is treated as gimbal lock
+GIMBAL_LOCK_TOLERANCE = 1e-7
+
+_AXES = {"x": 0, "y": 1, "z": 2}
+
+
+def _extrinsic_axes(order: str, intrinsic: bool) -> tuple[int, int, int]:
+    if order not in EULER_ORDERS:
+        raise ValueError(
+            f"unknown euler order {order!r}, expected one of {EULER_ORDERS}"
+        )
+
+    # intrinsic rotations about x, y, z are the extrinsic rotations about z, y, x
+    if intrinsic:
+        order = order[::-1]
+
+    return _AXES[order[0]], _AXES[order[1]], _AXES[order[2]]
+
+
+def _multiply(a: _Quaternion4, b: _Quaternion4) -> _Quaternion4:
+    ar, ai, aj, ak = a
+    br, bi, bj, bk = b
+    return (
+        ar * br - ai * bi - aj * bj - ak * bk,
+        ar * bi + ai * br + aj * bk - ak * bj,
+        ar * bj - ai * bk + aj * br + ak * bi,
+        ar * bk + ai * bj - aj * bi + ak * br,
+    )
+
+
+def _elementary(axis: int, cos_half: float, sin_half: float) -> _Quaternion4:
+    if axis == 0:
+        return cos_half, sin_half, 0.0, 0.0
+    if axis == 1:
+        return cos_half, 0.0, sin_half, 0.0
+    return cos_half, 0.0, 0.0, sin_half
+
+
+def _from_euler(
+    axes: tuple[int, int, int], first: float, second: float, third: float
+) -> Quaternion:
+    # the extrinsic rotation is third_rotation * second_rotation * first_rotation,
+    # the half angle sin and cos of each angle are evaluated once for all the components
+    axis_1, axis_2, axis_3 = axes
+    half_1, half_2, half_3 = first / 2, second / 2, third / 2
+    q = _multiply(
+        _elementary(axis_3, math.cos(half_3), math.sin(half_3)),
+        _multiply(
+            _elementary(axis_2, math.cos(half_2), math.sin(half_2)),
+            _elementary(axis_1, math.cos(half_1), math.sin(half_1)),
+        ),
+    )
+    return Quaternion._from_floats(*q)
+
+
+def _wrap_angle(angle: float) -> float:
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+def _to_euler(axes: tuple[int, int, int], q: Quaternion) -> Angles3:
+    # Bernardes & Viollet, "Quaternion to Euler angles conversion: A direct, general and
+    # computationally efficient method", 2022
+    i, j, k = axes
+    is_proper = i == k
+    if is_proper:
+        k = 3 - i - j
+
+    # +1 for an even permutation of the axes, -1 for an odd one
+    sign = (i - j) * (j - k) * (k - i) // 2
+    w = q.r
+    v = (q.i, q.j, q.k)
+
+    if is_proper:
+        a, b, c, d = w, v[i], v[j], v[k] * sign
+    else:
+        a, b, c, d = w - v[j], v[i] + v[k] * sign, v[j] + w, v[k] * sign - v[i]
+
+    second = 2 * math.atan2(math.hypot(c, d), math.hypot(a, b))
+    half_sum = math.atan2(b, a)
+    half_difference = math.atan2(d, c)
+
+    # in gimbal lock only the sum (or difference) of the first and third angles is known
+    if abs(second) <= GIMBAL_LOCK_TOLERANCE:
+        first, third = 0.0, 2 * half_sum
+    elif abs(second - math.pi) <= GIMBAL_LOCK_TOLERANCE:
+        first, third = 0.0, 2 * half_difference
+    else:
+        first, third = half_sum - half_difference, half_sum + half_difference
+
+    if not is_proper:
+        third *= sign
+        second -= math.pi / 2
+
+    # the second angle is already in [0, pi] or [-pi / 2, pi / 2], wrapping would turn pi into -pi
+    return _wrap_angle(first), second, _wrap_angle(third)
+
+
+def from_euler(
+    angles: Sequence[real_number], order: str = "xyz", intrinsic: bool = False
+) -> Quaternion:
+    """creates the unit quaternion of a sequence of 3 rotations
+
+    Args:
+        angles (Sequence[real_number]): the 3 angles, in radians
+        order (str, optional): the axes of the rotations, one of EULER_ORDERS. Defaults to "xyz".
+        intrinsic (bool, optional): rotates about the axes of the rotating frame instead of the fixed frame. Defaults to False.
+
+    Raises:
+        ValueError: when order is unknown or there are not 3 angles
+
+    Returns:
+        Quaternion: the rotation
+    """
+    axes = _extrinsic_axes(order, intrinsic)
+
+    if len(angles) != 3:
+        raise ValueError("expected 3 euler angles")
+
+    first, second, third = angles
+    if intrinsic:
+        first, third = third, first
+
+    return _from_euler(axes, first, second, third)
+
+
+def to_euler(q: Quaternion, order: str = "xyz", intrinsic: bool = False) -> Angles3:
+    """computes the euler angles of a unit quaternion, the inverse of from_euler
+
+    the first and third angles are in [-pi, pi), the second one is in [0, pi] for orders
+    that repeat an axis and in [-pi / 2, pi / 2] otherwise
+
+    Raises:
+        ValueError: when order is unknown
+
+    Returns:
+        Angles3: the 3 angles, in radians
+    """
+    first, second, third = _to_euler(_extrinsic_axes(order, intrinsic), q)
+
+    if intrinsic:
+        return third, second, first
+
+    return first, second, third
+
+
+def batch_from_euler(
+    first: Sequence[real_number],
+    second: Sequence[real_number],
+    third: Sequence[real_number],
+    order: str = "xyz",
+    intrinsic: bool = False,
+) -> list[Quaternion]:
+    """from_euler over columns of angles
+
+    Raises:
+        ValueError: when order is unknown or the columns have different lengths
+
+    Returns:
+        list[Quaternion]: a rotation per row of the columns
+    """
+    axes = _extrinsic_axes(order, intrinsic)
+
+    if not len(first) == len(second) == len(third):
+        raise ValueError("the angle columns must have the same length")
+
+    if intrinsic:
+        first, third = third, first
+
+    return [_from_euler(axes, a, b, c) for a, b, c in zip(first, second, third)]
+
+
+def batch_to_euler(
+    quaternions: Iterable[Quaternion], order: str = "xyz", intrinsic: bool = False
+) -> tuple[list[float], list[float], list[float]]:
+    """to_euler over many quaternions
+
+    Raises:
+        ValueError: when order is unknown
+
+    Returns:
+        tuple[list[float], list[float], list[float]]: the columns of the first, second and third angles
+    """
+    axes = _extrinsic_axes(order, intrinsic)
+    first: list[float] = []
+    second: list[float] = []
+    third: list[float] = []
+
+    for q in quaternions:
+        a, b, c = _to_euler(axes, q)
+        first.append(a)
+        second.append(b)
+        third.append(c)
+
+    if intrinsic:
+        return third, second, first
+
+    return first, second, third
+
+
+def from_axis_angle(axis: Vector, angle: real_number) -> Quaternion:
+    """creates the unit quaternion rotating by angle radians around axis
+
+    Raises:
+        ValueError: when axis is not 3 dimensional or is the zero vector
+
+    Returns:
+        Quaternion: the rotation
+    """
+    return batch_from_axis_angle((axis,), (angle,))[0]
+
+
+def to_axis_angle(q: Quaternion) -> tuple[Vector, float]:
+    """computes the axis and angle of a unit quaternion
+
+    Returns:
+        tuple[Vector, float]: the unit axis and the angle in [0, 2 * pi], the x axis when there is no rotation
+    """
+    axes, angles = batch_to_axis_angle((q,))
+    return axes[0], angles[0]
+
+
+def batch_from_axis_angle(
+    axes: Iterable[Vector], angles: Iterable[real_number]
+) -> list[Quaternion]:
+    """from_axis_angle over pairs of axes and angles
+
+    Raises:
+        ValueError: when an axis is not 3 dimensional or is the zero vector, or there is a different number of axes and angles
+    """
+    axes = list(axes)
+    angles = list(angles)
+
+    if len(axes) != len(angles):
+        raise ValueError("expected one angle per axis")
+
+    rotations: list[Quaternion] = []
+
+    for axis, angle in zip(axes, angles):
+        if axis.length != 3:
+            raise ValueError("rotation axes must be 3 dimensional")
+
+        x, y, z = axis.values
+        axis_abs = math.sqrt(x * x + y * y + z * z)
+        if axis_abs == 0:
+            raise ValueError("cannot rotate around the zero vector")
+
+        factor = math.sin(angle / 2) / axis_abs
+        rotations.append(
+            Quaternion._from_floats(
+                math.cos(angle / 2), x * factor, y * factor, z * factor
+            )
+        )
+
+    return rotations
+
+
+def batch_to_axis_angle(
+    quaternions: Iterable[Quaternion],
+) -> tuple[list[Vector], list[float]]:
+    """to_axis_angle over many quaternions
+
+    Returns:
+        tuple[list[Vector], list[float]]: the column of axes and the column of angles
+    """
+    axes: list[Vector] = []
+    angles: list[float] = []
+
+    for q in quaternions:
+        vector_abs = math.sqrt(q.i * q.i + q.j * q.j + q.k * q.k)
+
+        if vector_abs == 0:
+            axes.append(Vector._from_floats([1.0, 0.0, 0.0]))
+            angles.append(0.0)
+            continue
+
+        axes.append(
+            Vector._from_floats([q.i / vector_abs, q.j / vector_abs, q.k / vector_abs])
+        )
+        angles.append(2 * math.atan2(vector_abs, q.r))
+
+    return axes, angles
@@ -0,0 +1,181 @@
+import hashlib
+import math
+import random
+from typing import Iterator, MutableSequence
+from .quaternion import Quaternion
+from .vector import Vector
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+class Sampler:
+    """a seedable source of random rotations and vectors
+
+    the samples only depend on the seed and the stream, so spawning samplers with the same seed
+    in different processes gives the same independent streams in every run
+
+    Args:
+        seed (int): the seed
+        stream (int | str, optional): selects an independent stream of the same seed. Defaults to 0.
+    """
+
+    def __init__(self, seed: int, stream: int | str = 0) -> None:
+        self.seed = seed
+        self.stream = stream
+        # hashing keeps the streams of nearby seeds apart, unlike seeding with seed + stream
+        digest = hashlib.sha256(f"py_math_omm:{seed}:{stream}".encode()).digest()
+        self._random = random.Random(int.from_bytes(digest))
+
+    def spawn(self, count: int) -> list["Sampler"]:
+        """creates samplers for count parallel workers, worker n should use the n'th sampler"""
+        return [Sampler(self.seed, f"{self.stream}.{n}") for n in range(count)]
+
+    def fill_unit_quaternions(self, out: MutableSequence[float], count: int) -> None:
+        """writes count uniformly distributed unit quaternions into out as r, i, j, k values (Shoemake's method)
+
+        Raises:
+            ValueError: when out has less than 4 * count values
+        """
+        if len(out) < 4 * count:
+            raise ValueError("out is too small")
+
+        uniform = self._random.random
+        sqrt = math.sqrt
+        sin = math.sin
+        cos = math.cos
+        tau = math.tau
+
+        for offset in range(0, 4 * count, 4):
+            u1 = uniform()
+            a = tau * uniform()
+            b = tau * uniform()
+            s1 = sqrt(1 - u1)
+            s2 = sqrt(u1)
+            out[offset] = s2 * cos(b)
+            out[offset + 1] = s1 * sin(a)
+            out[offset + 2] = s1 * cos(a)
+            out[offset + 3] = s2 * sin(b)
+
+    def fill_gaussian(
+        self,
+        out: MutableSequence[float],
+        count: int,
+        mean: float = 0.0,
+        sigma: float = 1.0,
+    ) -> None:
+        """writes count normally distributed values into out
+
+        Raises:
+            ValueError: when out has less than count values
+        """
+        if len(out) < count:
+            raise ValueError("out is too small")
+
+        gauss = self._random.gauss
+        for index in range(count):
+            out[index] = gauss(mean, sigma)
+
+    def fill_unit_sphere(
+        self, out: MutableSequence[float], count: int, dimension: int = 3
+    ) -> None:
+        """writes count uniformly distributed points on the unit sphere into out, dimension values each
+
+        Raises:
+            ValueError: when out has less than dimension * count values
+        """
+        self._fill_ball(out, count, dimension, False)
+
+    def fill_unit_ball(
+        self, out: MutableSequence[float], count: int, dimension: int = 3
+    ) -> None:
+        """writes count uniformly distributed points in the unit ball into out, dimension values each
+
+        Raises:
+            ValueError: when out has less than dimension * count values
+        """
+        self._fill_ball(out, count, dimension, True)
+
+    def _fill_ball(
+        self, out: MutableSequence[float], count: int, dimension: int, inside: bool
+    ) -> None:
+        if len(out) < dimension * count:
+            raise ValueError("out is too small")
+
+        gauss = self._random.gauss
+        uniform = self._random.random
+        exponent = 1 / dimension
+
+        for offset in range(0, dimension * count, dimension):
+            # a normalized gaussian vector is uniform on the sphere, a zero vector is redrawn
+            norm = 0.0
+            while norm == 0:
+                values = [gauss(0.0, 1.0) for _ in range(dimension)]
+                norm = math.sqrt(math.sumprod(values, values))
+            # the radius is drawn right after its direction, so the points do not depend on
+            # how many are drawn at once
+            radius = uniform() ** exponent if inside else 1.0
+            for index, value in enumerate(values, offset):
+                out[index] = value / norm * radius
+
+    def unit_quaternions(self, count: int) -> list[Quaternion]:
+        values = [0.0] * (4 * count)
+        self.fill_unit_quaternions(values, count)
+        return [
+            Quaternion._from_floats(*values[offset : offset + 4])
+            for offset in range(0, 4 * count, 4)
+        ]
+
+    def _vectors(self, values: list[float], dimension: int) -> list[Vector]:
+        return [
+            Vector._from_floats(values[offset : offset + dimension])
+            for offset in range(0, len(values), dimension)
+        ]
+
+    def unit_sphere_vectors(self, count: int, dimension: int = 3) -> list[Vector]:
+        values = [0.0] * (dimension * count)
+        self.fill_unit_sphere(values, count, dimension)
+        return self._vectors(values, dimension)
+
+    def unit_ball_vectors(self, count: int, dimension: int = 3) -> list[Vector]:
+        values = [0.0] * (dimension * count)
+        self.fill_unit_ball(values, count, dimension)
+        return self._vectors(values, dimension)
+
+    def gaussian_vectors(
+        self, count: int, dimension: int = 3, mean: float = 0.0, sigma: float = 1.0
+    ) -> list[Vector]:
+        values = [0.0] * (dimension * count)
+        self.fill_gaussian(values, dimension * count, mean, sigma)
+        return self._vectors(values, dimension)
+
+    def iter_unit_quaternions(
+        self, count: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list[Quaternion]]:
+        """lazily generates count unit quaternions in chunks of chunk_size"""
+        for start in range(0, count, chunk_size):
+            yield self.unit_quaternions(min(chunk_size, count - start))
+
+    def iter_unit_sphere_vectors(
+        self, count: int, dimension: int = 3, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list[Vector]]:
+        for start in range(0, count, chunk_size):
+            yield self.unit_sphere_vectors(min(chunk_size, count - start), dimension)
+
+    def iter_unit_ball_vectors(
+        self, count: int, dimension: int = 3, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list[Vector]]:
+        for start in range(0, count, chunk_size):
+            yield self.unit_ball_vectors(min(chunk_size, count - start), dimension)
+
+    def iter_gaussian_vectors(
+        self,
+        count: int,
+        dimension: int = 3,
+        mean: float = 0.0,
+        sigma: float = 1.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[Vector]]:
+        for start in range(0, count, chunk_size):
+            yield self.gaussian_vectors(
+                min(chunk_size, count - start), dimension, mean, sigma
+            )
@@ -0,0 +1,258 @@
+import asyncio
+import inspect
+import struct
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from .types import withNone
+from .quaternion import Quaternion
+from .vector import Vector
+from .rotation import rotate_vectors, slerp
+
+type Batch = list
+type Stage = Callable[[Batch], Batch | Awaitable[Batch]]
+type Sink = Callable[[Batch], Awaitable[None]]
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_LATENCY = 0.005
+DEFAULT_QUEUE_SIZE = 4
+
+
+class RecordCodec:
+    """fixed size binary records of little endian doubles
+
+    Args:
+        dimension (int): number of doubles in a record
+        decode (Callable[[tuple[float, ...]], object]): creates an item from the values of a record
+        encode (Callable[[object], Iterable[float]]): returns the values of an item
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        decode: Callable[[tuple[float, ...]], object],
+        encode: Callable[[object], Iterable[float]],
+    ) -> None:
+        self.format = struct.Struct(f"<{dimension}d")
+        self.size = self.format.size
+        self._decode = decode
+        self._encode = encode
+
+    def decode_many(self, data: bytes | bytearray | memoryview) -> Batch:
+        decode = self._decode
+        return [decode(values) for values in self.format.iter_unpack(data)]
+
+    def encode_many(self, items: Iterable[object]) -> bytes:
+        pack = self.format.pack
+        encode = self._encode
+        return b"".join(pack(*encode(item)) for item in items)
+
+
+quaternion_codec = RecordCodec(
+    4,
+    lambda values: Quaternion._from_floats(*values),
+    lambda q: (q.r, q.i, q.j, q.k),
+)
+
+
+def vector_codec(dimension: int) -> RecordCodec:
+    return RecordCodec(
+        dimension, lambda values: Vector._from_floats(list(values)), lambda v: v.values
+    )
+
+
+async def read_batches(
+    reader: asyncio.StreamReader,
+    codec: RecordCodec,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_latency: float = DEFAULT_MAX_LATENCY,
+) -> AsyncIterator[Batch]:
+    """reads records from reader and groups them into batches
+
+    a batch is yielded once it has batch_size records, or max_latency seconds after its first
+    record arrived, whichever comes first
+
+    Raises:
+        asyncio.IncompleteReadError: when the stream ends in the middle of a record
+
+    Yields:
+        AsyncIterator[Batch]: the decoded batches
+    """
+    loop = asyncio.get_running_loop()
+    batch_bytes = batch_size * codec.size
+    buffer = bytearray()
+    at_eof = False
+
+    while not at_eof:
+        deadline: withNone[float] = None
+
+        while len(buffer) < batch_bytes:
+            if deadline is None and len(buffer) >= codec.size:
+                deadline = loop.time() + max_latency
+
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                break
+
+            try:
+                # a read cancelled by the timeout does not consume any data
+                chunk = await asyncio.wait_for(
+                    reader.read(batch_bytes - len(buffer)), timeout
+                )
+            except TimeoutError:
+                break
+
+            if not chunk:
+                at_eof = True
+                break
+
+            buffer += chunk
+
+        complete = len(buffer) - len(buffer) % codec.size
+        if complete:
+            yield codec.decode_many(memoryview(buffer)[:complete])
+            del buffer[:complete]
+
+    if buffer:
+        raise asyncio.IncompleteReadError(bytes(buffer), codec.size)
+
+
+class Pipeline:
+    """reads records from a stream, passes them through stages in micro batches and emits them to a sink
+
+    every stage runs in its own task and the stages are connected by bounded queues, so a slow
+    stage or sink stops the reading of the stream instead of buffering without a limit
+
+    a stage that keeps state between batches can have a reset() attribute, run calls it before
+    every stream so a reused pipeline does not carry the state of one stream into the next
+
+    Args:
+        codec (RecordCodec): the format of the records
+        stages (Sequence[Stage]): functions (or coroutine functions) from a batch to a batch
+        batch_size (int, optional): the most records in a batch. Defaults to DEFAULT_BATCH_SIZE.
+        max_latency (float, optional): the most seconds a record waits for its batch to fill. Defaults to DEFAULT_MAX_LATENCY.
+        queue_size (int, optional): the most batches waiting between two stages. Defaults to DEFAULT_QUEUE_SIZE.
+    """
+
+    def __init__(
+        self,
+        codec: RecordCodec,
+        stages: Sequence[Stage] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch size must be positive")
+
+        self.codec = codec
+        self.stages = list(stages)
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.queue_size = queue_size
+
+    async def run(self, reader: asyncio.StreamReader, sink: Sink) -> int:
+        """processes reader until it ends
+
+        Raises:
+            asyncio.IncompleteReadError: when the stream ends in the middle of a record
+
+        Returns:
+            int: number of items emitted to the sink
+        """
+        queues: list[asyncio.Queue[withNone[Batch]]] = [
+            asyncio.Queue(self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+        emitted = 0
+
+        for stage in self.stages:
+            reset = getattr(stage, "reset", None)
+            if reset is not None:
+                reset()
+
+        async def produce() -> None:
+            async for batch in read_batches(
+                reader, self.codec, self.batch_size, self.max_latency
+            ):
+                await queues[0].put(batch)
+            await queues[0].put(None)
+
+        async def process(stage: Stage, source: asyncio.Queue, target: asyncio.Queue):
+            while (batch := await source.get()) is not None:
+                result = stage(batch)
+                if inspect.isawaitable(result):
+                    result = await result
+                if result:
+                    await target.put(result)
+            await target.put(None)
+
+        async def consume() -> None:
+            nonlocal emitted
+            while (batch := await queues[-1].get()) is not None:
+                await sink(batch)
+                emitted += len(batch)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for stage, source, target in zip(self.stages, queues, queues[1:]):
+                    group.create_task(process(stage, source, target))
+                group.create_task(consume())
+        except ExceptionGroup as error:
+            # the first failure cancels the other tasks, so there is a single error to report
+            if len(error.exceptions) == 1:
+                raise error.exceptions[0]
+            raise
+
+        return emitted
+
+
+def normalize(batch: Batch) -> Batch:
+    return [item.normalize() for item in batch]
+
+
+def rotate(rotation: Quaternion) -> Stage:
+    """a stage that rotates vectors by the unit quaternion rotation, or applies it before quaternions"""
+
+    def stage(batch: Batch) -> Batch:
+        if batch and isinstance(batch[0], Vector):
+            return rotate_vectors(rotation, batch)
+        return [rotation * q for q in batch]
+
+    return stage
+
+
+def filter_items(predicate: Callable[[object], bool]) -> Stage:
+    def stage(batch: Batch) -> Batch:
+        return [item for item in batch if predicate(item)]
+
+    return stage
+
+
+def interpolate(steps: int) -> Stage:
+    """a stage that upsamples unit quaternions, adding steps - 1 slerped quaternions between every two consecutive ones
+
+    the last quaternion of a batch is kept to interpolate towards the first one of the next batch,
+    stage.reset() forgets it, Pipeline.run calls it at the start of every stream
+    """
+    if steps < 1:
+        raise ValueError("steps must be positive")
+
+    previous: withNone[Quaternion] = None
+
+    def stage(batch: Batch) -> Batch:
+        nonlocal previous
+        result: Batch = []
+
+        for q in batch:
+            if previous is not None:
+                result.extend(slerp(previous, q, s / steps) for s in range(1, steps))
+            result.append(q)
+            previous = q
+
+        return result
+
+    def reset() -> None:
+        nonlocal previous
+        previous = None
+
+    stage.reset = reset
+    return stage
@@ -0,0 +1,288 @@
+import bisect
+import math
+from typing import Iterable, Sequence
+from .types import withNone
+from .quaternion import Quaternion
+from .rotation import angular_distance, slerp
+
+type Keyframe = tuple[float, Quaternion]
+
+DEFAULT_QUANTIZATION_BITS = 15
+
+_SMALLEST_THREE_LIMIT = 1 / math.sqrt(2)
+
+
+def encode_smallest_three(q: Quaternion, bits: int = DEFAULT_QUANTIZATION_BITS) -> int:
+    """packs a unit quaternion into an integer of 3 * bits + 2 bits
+
+    the largest component is dropped (the sign of q is chosen to make it positive) and the
+    other three, which are within +-1/sqrt(2), are quantized to bits each
+    """
+    values = (q.r, q.i, q.j, q.k)
+    largest = max(range(4), key=lambda index: abs(values[index]))
+    sign = -1.0 if values[largest] < 0 else 1.0
+    steps = (1 << bits) - 1
+    code = largest
+
+    for index, value in enumerate(values):
+        if index == largest:
+            continue
+        scaled = (sign * value + _SMALLEST_THREE_LIMIT) / (2 * _SMALLEST_THREE_LIMIT)
+        code = (code << bits) | min(steps, max(0, round(scaled * steps)))
+
+    return code
+
+
+def decode_smallest_three(
+    code: int, bits: int = DEFAULT_QUANTIZATION_BITS
+) -> Quaternion:
+    steps = (1 << bits) - 1
+    mask = steps
+    smallest: list[float] = []
+
+    for shift in (2 * bits, bits, 0):
+        step = (code >> shift) & mask
+        smallest.append(
+            step / steps * 2 * _SMALLEST_THREE_LIMIT - _SMALLEST_THREE_LIMIT
+        )
+
+    largest = code >> (3 * bits)
+    values = smallest[:largest] + [0.0] + smallest[largest:]
+    values[largest] = math.sqrt(max(0.0, 1 - math.sumprod(smallest, smallest)))
+    norm = math.sqrt(math.sumprod(values, values))
+    return Quaternion._from_floats(*(value / norm for value in values))
+
+
+class CompressedTrajectory:
+    """a rotation trajectory stored as keyframes, reconstructed by slerp between them
+
+    Args:
+        keyframes (Iterable[Keyframe]): the (time, unit quaternion) keyframes, in increasing time
+        codes (withNone[list[int]], optional): the smallest three codes of the keyframes when they were quantized. Defaults to None.
+        bits (withNone[int], optional): the bits per component of the codes. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        keyframes: Iterable[Keyframe],
+        codes: withNone[list[int]] = None,
+        bits: withNone[int] = None,
+    ) -> None:
+        keyframes = list(keyframes)
+        self.times = [t for t, _ in keyframes]
+        self.rotations = [q for _, q in keyframes]
+        self.codes = codes
+        self.bits = bits
+
+    @classmethod
+    def from_codes(
+        cls,
+        times: Sequence[float],
+        codes: Sequence[int],
+        bits: int = DEFAULT_QUANTIZATION_BITS,
+    ) -> "CompressedTrajectory":
+        if len(times) != len(codes):
+            raise ValueError("expected one code per time")
+
+        rotations = [decode_smallest_three(code, bits) for code in codes]
+        return cls(zip(times, rotations), list(codes), bits)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def sample(self, t: float) -> Quaternion:
+        """reconstructs the rotation at time t, times outside the keyframes are clamped
+
+        Raises:
+            ValueError: when there are no keyframes
+        """
+        times = self.times
+
+        if not times:
+            raise ValueError("cannot sample an empty trajectory")
+
+        if t <= times[0]:
+            return self.rotations[0]
+        if t >= times[-1]:
+            return self.rotations[-1]
+
+        end = bisect.bisect_right(times, t)
+        start_time, end_time = times[end - 1], times[end]
+        return slerp(
+            self.rotations[end - 1],
+            self.rotations[end],
+            (t - start_time) / (end_time - start_time),
+        )
+
+    def resample(self, times: Iterable[float]) -> list[Quaternion]:
+        return [self.sample(t) for t in times]
+
+
+def _rotation_vector(q: Quaternion) -> tuple[float, float, float]:
+    # the axis times the angle, in [0, pi], of the unit quaternion q
+    sign = -1.0 if q.r < 0 else 1.0
+    vector_abs = math.hypot(q.i, q.j, q.k)
+
+    if vector_abs == 0:
+        return 0.0, 0.0, 0.0
+
+    factor = sign * 2 * math.atan2(vector_abs, sign * q.r) / vector_abs
+    return q.i * factor, q.j * factor, q.k * factor
+
+
+class TrajectoryCompressor:
+    """online keyframe selection, every rotation pushed is reconstructed within max_error radians
+
+    a sample is kept as a keyframe only when the slerp from the previous keyframe to the newest
+    sample could move one of the samples in between further than max_error
+
+    the slerp from keyframe a at time t0 reconstructs time t as a * exp((t - t0) * w), so a sample
+    q at time t is within max_error of it when |w - v / (t - t0)| <= max_error / (t - t0), where v
+    is the rotation vector of a.conjugate() * q (the exponential map does not lengthen distances).
+    the samples since the keyframe are kept as a single ball inside the intersection of their
+    balls, which makes a push O(1) and the check conservative
+
+    Args:
+        max_error (float): the largest allowed angle, in radians, between a sample and its reconstruction
+        quantization_bits (withNone[int], optional): quantizes the keyframes with smallest three encoding, the error of the quantized keyframes is accounted for. Defaults to None.
+    """
+
+    def __init__(
+        self, max_error: float, quantization_bits: withNone[int] = None
+    ) -> None:
+        if max_error < 0:
+            raise ValueError("max error cannot be negative")
+
+        self.max_error = max_error
+        self.quantization_bits = quantization_bits
+        self.codes: list[int] = []
+        self._anchor: withNone[Keyframe] = None
+        self._last: withNone[Keyframe] = None
+        self._center: tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._radius = 0.0
+
+    def _keyframe(self, t: float, q: Quaternion) -> Keyframe:
+        if self.quantization_bits is None:
+            return t, q
+
+        code = encode_smallest_three(q, self.quantization_bits)
+        return t, decode_smallest_three(code, self.quantization_bits)
+
+    def _emit(self, t: float, q: Quaternion) -> Keyframe:
+        keyframe = self._keyframe(t, q)
+
+        if self.quantization_bits is not None:
+            if angular_distance(keyframe[1], q) > self.max_error:
+                raise ValueError("the quantization error is larger than max error")
+            self.codes.append(encode_smallest_three(q, self.quantization_bits))
+
+        self._anchor = keyframe
+        return keyframe
+
+    def _velocity(self, t: float, q: Quaternion) -> tuple[float, float, float]:
+        # the angular velocity of the slerp from the anchor that reaches q at t
+        start_time, start = self._anchor
+        duration = t - start_time
+        x, y, z = _rotation_vector(start.conjugate() * q)
+        return x / duration, y / duration, z / duration
+
+    def _constraint(
+        self, t: float, q: Quaternion
+    ) -> tuple[tuple[float, float, float], float]:
+        return self._velocity(t, q), self.max_error / (t - self._anchor[0])
+
+    def _intersect(self, center: tuple[float, float, float], radius: float) -> None:
+        # replaces the ball with the largest ball inside its intersection with the given one,
+        # a negative radius means no slerp fits every sample
+        distance = math.dist(self._center, center)
+
+        if distance + radius <= self._radius:
+            self._center, self._radius = center, radius
+        elif distance + self._radius > radius:
+            new_radius = (self._radius + radius - distance) / 2
+            shift = (self._radius - new_radius) / distance
+            self._center = tuple(
+                c + (o - c) * shift for c, o in zip(self._center, center)
+            )
+            self._radius = new_radius
+
+    def push(self, t: float, q: Quaternion) -> list[Keyframe]:
+        """adds the next sample
+
+        Raises:
+            ValueError: when t is not after the previous sample, or a quantized keyframe is off by more than max error
+
+        Returns:
+            list[Keyframe]: the keyframes that became final
+        """
+        if self._anchor is None:
+            return [self._emit(t, q)]
+
+        last_time = self._anchor[0] if self._last is None else self._last[0]
+        if t <= last_time:
+            raise ValueError("sample times must be increasing")
+
+        if self._last is None:
+            self._center, self._radius = self._constraint(t, q)
+            self._last = (t, q)
+            return []
+
+        velocity = self._velocity(*self._keyframe(t, q))
+        if math.dist(velocity, self._center) <= self._radius:
+            self._intersect(*self._constraint(t, q))
+            self._last = (t, q)
+            return []
+
+        keyframe = self._emit(*self._last)
+        self._center, self._radius = self._constraint(t, q)
+        self._last = (t, q)
+        return [keyframe]
+
+    def finish(self) -> list[Keyframe]:
+        """ends the trajectory
+
+        Returns:
+            list[Keyframe]: the last keyframe, if it was not emitted yet
+        """
+        if self._last is None:
+            return []
+
+        keyframe = self._emit(*self._last)
+        self._last = None
+        return [keyframe]
+
+
+def compress(
+    times: Sequence[float],
+    rotations: Sequence[Quaternion],
+    max_error: float,
+    quantization_bits: withNone[int] = None,
+) -> CompressedTrajectory:
+    """compresses a sampled rotation trajectory to keyframes
+
+    Args:
+        times (Sequence[float]): the increasing sample times
+        rotations (Sequence[Quaternion]): the unit quaternion sampled at each time
+        max_error (float): the largest allowed angle, in radians, between a sample and its reconstruction
+        quantization_bits (withNone[int], optional): quantizes the keyframes with smallest three encoding. Defaults to None.
+
+    Raises:
+        ValueError: when there is a different number of times and rotations, the times are not increasing or a quantized keyframe is off by more than max error
+
+    Returns:
+        CompressedTrajectory: the keyframes
+    """
+    if len(times) != len(rotations):
+        raise ValueError("expected one rotation per time")
+
+    compressor = TrajectoryCompressor(max_error, quantization_bits)
+    keyframes: list[Keyframe] = []
+
+    for t, q in zip(times, rotations):
+        keyframes.extend(compressor.push(t, q))
+    keyframes.extend(compressor.finish())
+
+    if quantization_bits is None:
+        return CompressedTrajectory(keyframes)
+
+    return CompressedTrajectory(keyframes, compressor.codes, quantization_bits)
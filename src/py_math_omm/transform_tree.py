@@ -0,0 +1,186 @@
+from typing import Iterable
+from .types import withNone
+from .quaternion import Quaternion
+from .vector import Vector
+from .rotation import rotate_vector, transform_points
+
+
+class TransformTree:
+    """a hierarchy of local rigid transforms with cached world transforms
+
+    every node holds a local rotation (a unit quaternion) and a 3 dimensional translation
+    relative to its parent. world transforms are computed lazily and cached, changing a
+    local transform only invalidates the subtree under the changed node
+    """
+
+    def __init__(self) -> None:
+        self._parents: list[withNone[int]] = []
+        self._children: list[list[int]] = []
+        self._local_rotations: list[Quaternion] = []
+        self._local_translations: list[Vector] = []
+        self._world_rotations: list[withNone[Quaternion]] = []
+        self._world_translations: list[withNone[Vector]] = []
+        self._dirty: list[bool] = []
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def _check_node(self, node: int) -> None:
+        if not 0 <= node < len(self._parents):
+            raise IndexError(f"no node {node} in the transform tree")
+
+    def add_node(
+        self,
+        rotation: withNone[Quaternion] = None,
+        translation: withNone[Vector] = None,
+        parent: withNone[int] = None,
+    ) -> int:
+        """adds a node to the tree
+
+        Args:
+            rotation (withNone[Quaternion], optional): the local rotation, the identity when None. Defaults to None.
+            translation (withNone[Vector], optional): the local translation, the zero vector when None. Defaults to None.
+            parent (withNone[int], optional): the parent node, the new node is a root when None. Defaults to None.
+
+        Raises:
+            IndexError: when parent is not a node of the tree
+            ValueError: when translation is not 3 dimensional
+
+        Returns:
+            int: the new node
+        """
+        if parent is not None:
+            self._check_node(parent)
+
+        if translation is not None and translation.length != 3:
+            raise ValueError("translations must be 3 dimensional")
+
+        node = len(self._parents)
+        self._parents.append(parent)
+        self._children.append([])
+        self._local_rotations.append(Quaternion(1))
+        self._local_translations.append(Vector(0, 0, 0))
+        self._world_rotations.append(None)
+        self._world_translations.append(None)
+        self._dirty.append(True)
+
+        if parent is not None:
+            self._children[parent].append(node)
+
+        self.set_local(node, rotation, translation)
+        return node
+
+    def parent(self, node: int) -> withNone[int]:
+        self._check_node(node)
+        return self._parents[node]
+
+    def children(self, node: int) -> list[int]:
+        self._check_node(node)
+        return list(self._children[node])
+
+    def is_dirty(self, node: int) -> bool:
+        self._check_node(node)
+        return self._dirty[node]
+
+    def local_transform(self, node: int) -> tuple[Quaternion, Vector]:
+        self._check_node(node)
+        # a copy, changing the translation in place would skip the invalidation
+        return self._local_rotations[node], Vector.from_iterable(
+            self._local_translations[node]
+        )
+
+    def set_local(
+        self,
+        node: int,
+        rotation: withNone[Quaternion] = None,
+        translation: withNone[Vector] = None,
+    ) -> None:
+        """changes the local transform of node, None keeps the current value
+
+        Raises:
+            IndexError: when node is not a node of the tree
+            ValueError: when translation is not 3 dimensional
+        """
+        self._check_node(node)
+
+        if translation is not None:
+            if translation.length != 3:
+                raise ValueError("translations must be 3 dimensional")
+            self._local_translations[node] = Vector.from_iterable(translation)
+
+        if rotation is not None:
+            self._local_rotations[node] = rotation
+
+        self._invalidate(node)
+
+    def _invalidate(self, node: int) -> None:
+        # a dirty node only has dirty descendants, so the walk stops at dirty nodes
+        dirty = self._dirty
+        children = self._children
+        dirty[node] = True
+        stack = list(children[node])
+
+        while stack:
+            child = stack.pop()
+            if not dirty[child]:
+                dirty[child] = True
+                stack.extend(children[child])
+
+    def world_transform(self, node: int) -> tuple[Quaternion, Vector]:
+        """returns the world rotation and translation of node, recomputing only the dirty ancestors
+
+        Raises:
+            IndexError: when node is not a node of the tree
+        """
+        rotation, translation = self._world_transform(node)
+        # a copy, so changing it does not change the cache
+        return rotation, Vector.from_iterable(translation)
+
+    def _world_transform(self, node: int) -> tuple[Quaternion, Vector]:
+        self._check_node(node)
+
+        dirty = self._dirty
+        chain: list[int] = []
+        current = node
+
+        while current is not None and dirty[current]:
+            chain.append(current)
+            current = self._parents[current]
+
+        for current in reversed(chain):
+            self._recompute(current)
+
+        return self._world_rotations[node], self._world_translations[node]
+
+    def _recompute(self, node: int) -> None:
+        parent = self._parents[node]
+        rotation = self._local_rotations[node]
+        translation = self._local_translations[node]
+
+        if parent is None:
+            self._world_rotations[node] = rotation
+            self._world_translations[node] = translation
+        else:
+            parent_rotation = self._world_rotations[parent]
+            self._world_rotations[node] = parent_rotation * rotation
+            self._world_translations[node] = self._world_translations[
+                parent
+            ] + rotate_vector(parent_rotation, translation)
+
+        self._dirty[node] = False
+
+    def update(self) -> None:
+        """recomputes every dirty world transform"""
+        for node in range(len(self._parents)):
+            if self._dirty[node]:
+                self._world_transform(node)
+
+    def transform_points(self, node: int, points: Iterable[Vector]) -> list[Vector]:
+        """transforms points from the local space of node to world space
+
+        Raises:
+            IndexError: when node is not a node of the tree
+            ValueError: when one of the points is not 3 dimensional
+        """
+        rotation, translation = self._world_transform(node)
+        return transform_points(rotation, translation, points)
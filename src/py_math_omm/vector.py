@@ -1,6 +1,6 @@
-from typing import Iterable, SupportsIndex, overload
-from .types import withNone
-from .quaternion import real_number
+from typing import Iterable, Iterator, Sequence, SupportsIndex, overload
+from .types import withNone, real_number
+from .kernels import get_kernel
 import math
 
 
@@ -12,6 +12,13 @@ class Vector:
     def from_iterable(cls, values: Iterable[real_number]) -> "Vector":
         return cls(*values)
 
+    @staticmethod
+    def _from_floats(values: list[float]) -> "Vector":
+        # skips the float conversion of __init__, values must already be floats
+        vector = Vector.__new__(Vector)
+        vector.values = values
+        return vector
+
     @property
     def length(self) -> int:
         return len(self.values)
@@ -36,6 +43,10 @@ class Vector:
         if self.length == 0:
             return None
 
+        kernel = get_kernel("dot", self.length)
+        if kernel is not None:
+            return kernel(self.values, other.values)
+
         res: float = 0
 
         for i in range(self.length):
@@ -49,6 +60,46 @@ class Vector:
     def normalize(self) -> "Vector":
         return self / abs(self)
 
+    def normalize_into(self, out: withNone["Vector"] = None) -> "Vector":
+        """writes the normalized self into out without creating a new vector
+
+        Args:
+            out (withNone[Vector], optional): vector (or view) to write into, self when None. Defaults to None.
+
+        Raises:
+            ValueError: when out has a different length than self
+
+        Returns:
+            Vector: out
+        """
+        if out is None:
+            out = self
+
+        if out.length != self.length:
+            raise ValueError("cannot normalize into a vector of a different length")
+
+        factor = 1 / abs(self)
+        values = self.values
+        out_values = out.values
+
+        for i in range(self.length):
+            out_values[i] = values[i] * factor
+
+        return out
+
+    def view(
+        self,
+        start: withNone[SupportsIndex] = None,
+        stop: withNone[SupportsIndex] = None,
+        step: withNone[SupportsIndex] = None,
+    ) -> "VectorView":
+        """creates a view of the window [start:stop:step] of self, without copying
+
+        Returns:
+            VectorView: the view, writes to it are written through to self
+        """
+        return VectorView(self, start, stop, step)
+
     def angle(self, other: "Vector") -> float:
         return math.acos(self.dot(other) / (abs(self) * abs(other)))
 
@@ -79,6 +130,10 @@ class Vector:
         if self.length != other.length:
             return False
 
+        kernel = get_kernel("is_parralel", self.length)
+        if kernel is not None:
+            return kernel(self.values, other.values)
+
         factor: withNone[float] = None
 
         for i in range(self.length):
@@ -104,6 +159,11 @@ class Vector:
         if length < other_length:
             return other.__add__(self)
 
+        if length == other_length:
+            kernel = get_kernel("add", length)
+            if kernel is not None:
+                return Vector._from_floats(kernel(self.values, other.values))
+
         new_values_generator = (
             (self.values[i] + other.values[i] if i < other_length else self.values[i])
             for i in range(length)
@@ -155,8 +215,8 @@ class Vector:
     ) -> None:
         self.values[key] = value
 
-    def __iter__(self):
-        return self.values
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values)
 
     def __eq__(self, other: object, /) -> bool:
         if not isinstance(other, Vector):
@@ -165,6 +225,10 @@ class Vector:
         if self.length != other.length:
             return False
 
+        kernel = get_kernel("eq", self.length)
+        if kernel is not None:
+            return kernel(self.values, other.values)
+
         for i in range(self.length):
             if self.values[i] != other.values[i]:
                 return False
@@ -179,3 +243,127 @@ class Vector:
 
     def __str__(self) -> str:
         return f"({", ".join(v.__str__() for v in self.values)})"
+
+
+class _ViewValues:
+    """a write-through sequence over the indices of a base list"""
+
+    def __init__(self, base: list[float], indices: range) -> None:
+        self.base = base
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, i: SupportsIndex | slice, /) -> float | list[float]:
+        if isinstance(i, slice):
+            base = self.base
+            return [base[k] for k in self.indices[i]]
+
+        return self.base[self.indices[i]]
+
+    def __setitem__(
+        self, key: SupportsIndex | slice, value: float | Iterable[float], /
+    ) -> None:
+        if isinstance(key, slice):
+            indices = self.indices[key]
+            new_values = [float(v) for v in value]
+
+            if len(new_values) != len(indices):
+                raise ValueError("cannot change the length of a vector view")
+
+            base = self.base
+            for k, v in zip(indices, new_values):
+                base[k] = v
+            return
+
+        self.base[self.indices[key]] = float(value)
+
+    def __iter__(self) -> Iterator[float]:
+        base = self.base
+        return (base[k] for k in self.indices)
+
+
+def _snapshot_if_shared(values: _ViewValues, other: Vector) -> Sequence[float]:
+    # a view sharing the storage of values could be changed while it is read
+    other_values = other.values
+    if other_values is values.base or (
+        isinstance(other_values, _ViewValues) and other_values.base is values.base
+    ):
+        return list(other_values)
+    return other_values
+
+
+class VectorView(Vector):
+    """a Vector that refers to a strided window of another vector's values
+
+    reads and writes go straight to the parent's storage, so no values are copied, the in
+    place operators (+=, -=, *= and /=) update the parent as well
+    """
+
+    def __init__(
+        self,
+        parent: Vector,
+        start: withNone[SupportsIndex] = None,
+        stop: withNone[SupportsIndex] = None,
+        step: withNone[SupportsIndex] = None,
+    ) -> None:
+        window = slice(start, stop, step)
+
+        if isinstance(parent, VectorView):
+            # a view of a view refers to the same base storage
+            base = parent.values.base
+            indices = parent.values.indices[window]
+        else:
+            base = parent.values
+            indices = range(*window.indices(parent.length))
+
+        self.parent = parent
+        self.values = _ViewValues(base, indices)
+
+    @property
+    def length(self) -> int:
+        return len(self.values.indices)
+
+    def copy(self) -> Vector:
+        return Vector.from_iterable(self.values)
+
+    def __iadd__(self, other: "Vector", /) -> "VectorView":
+        other_length: int = other.length
+        if self.length < other_length:
+            raise ValueError("cannot add a longer vector in place")
+
+        values = self.values
+        other_values = _snapshot_if_shared(values, other)
+
+        for i in range(other_length):
+            values[i] += other_values[i]
+
+        return self
+
+    def __isub__(self, other: "Vector", /) -> "VectorView":
+        other_length: int = other.length
+        if self.length < other_length:
+            raise ValueError("cannot subtract a longer vector in place")
+
+        values = self.values
+        other_values = _snapshot_if_shared(values, other)
+
+        for i in range(other_length):
+            values[i] -= other_values[i]
+
+        return self
+
+    def __imul__(self, other: real_number, /) -> "VectorView":
+        values = self.values
+
+        for i in range(self.length):
+            values[i] *= other
+
+        return self
+
+    def __itruediv__(self, other: real_number, /) -> "VectorView":
+        return self.__imul__(1 / other)
+
+    def __repr__(self) -> str:
+        return f"VectorView({", ".join(v.__repr__() for v in self.values)})"